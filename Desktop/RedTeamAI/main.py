@@ -9,7 +9,20 @@ import os
 # Ensure the project root is in the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def _install_event_loop_policy() -> None:
+    """Use uvloop for the worker event loops when it is installed (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    import asyncio
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
+    # Must run before any worker creates its asyncio loop
+    _install_event_loop_policy()
+
     from PyQt6.QtWidgets import QApplication
     from PyQt6.QtCore import Qt
 
@@ -1,13 +1,14 @@
 """ReAct loop agent: Reasoning + Acting with typed AgentEvents."""
 from __future__ import annotations
 import asyncio
-import json
-import uuid
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Callable, Optional
 
 from redteamai.ai.base import AIBackend, ToolCall
 from redteamai.ai.message_history import MessageHistory
+from redteamai.ai.tool_manifest import array_param, build_tool_schema, string_param
 from redteamai.utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -15,28 +16,28 @@ log = get_logger(__name__)
 
 # ── Agent Events ──────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class TextChunkEvent:
     text: str
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingEvent:
     text: str
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallEvent:
     tool_name: str
     arguments: dict
     call_id: str
 
-@dataclass
+@dataclass(slots=True)
 class ToolResultEvent:
     tool_name: str
     call_id: str
     output: str
     error: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ConfirmationRequiredEvent:
     tool_name: str
     command: str
@@ -45,12 +46,12 @@ class ConfirmationRequiredEvent:
     confirm_event: asyncio.Event = field(default_factory=asyncio.Event)
     confirmed: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class AgentDoneEvent:
     final_response: str
     iterations: int
 
-@dataclass
+@dataclass(slots=True)
 class AgentErrorEvent:
     error: str
 
@@ -60,8 +61,35 @@ AgentEvent = (
     ConfirmationRequiredEvent | AgentDoneEvent | AgentErrorEvent
 )
 
+# Streamed text is flushed to the GUI every _FLUSH_CHARS chars or _FLUSH_INTERVAL seconds
+_FLUSH_CHARS = 64
+_FLUSH_INTERVAL = 0.016
+
 # ── Dangerous tool detection ──────────────────────────────────────────────────
-DANGEROUS_TOOLS = {"metasploit_exec", "exploit_run", "ffuf", "gobuster"}
+DANGEROUS_TOOLS = frozenset({"metasploit_exec", "exploit_run", "ffuf", "gobuster"})
+# Longest argument shown in a confirmation preview
+_PREVIEW_ARG_MAX = 120
+
+# ── Internal tools (handled by the agent itself) ─────────────────────────────
+PRUNE_CONTEXT_TOOL = "prune_context"
+PRUNE_CONTEXT_SCHEMA = build_tool_schema(
+    name=PRUNE_CONTEXT_TOOL,
+    description=(
+        "Free context space by deleting earlier tool calls and their outputs "
+        "once they are no longer needed. Summarize anything worth keeping in "
+        "`memory` first; it is stored in place of the deleted results."
+    ),
+    parameters={
+        "memory": string_param("Notes to keep from the outputs being deleted"),
+        "delete_ids": array_param("IDs of earlier tool calls to delete"),
+    },
+    required=["memory", "delete_ids"],
+)
+
+# ── Tool execution pool ───────────────────────────────────────────────────────
+# Shared by all agents; bounds how many blocking tools run at once
+MAX_PARALLEL_TOOLS = 4
+_TOOL_POOL = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOLS, thread_name_prefix="tool")
 
 # ── Agent ─────────────────────────────────────────────────────────────────────
 
@@ -82,37 +110,55 @@ class RedTeamAgent:
     ):
         self.backend = backend
         self.tool_executor = tool_executor
-        self.tools_manifest = tools_manifest
+        self.tools_manifest = [*tools_manifest, PRUNE_CONTEXT_SCHEMA] if tools_manifest else tools_manifest
+        backend.set_tools(self.tools_manifest)
         self.history = history
         self.max_iterations = max_iterations
         self.require_confirm = require_confirm_dangerous
+        # Tools that need user confirmation; empty when confirmation is disabled
+        self._needs_confirm: frozenset[str] = DANGEROUS_TOOLS if require_confirm_dangerous else frozenset()
 
     async def run(self, user_message: str) -> AsyncIterator[AgentEvent]:
         """Run the ReAct loop for a user message, yielding events."""
         self.history.add_user(user_message)
-        self.history.prune()
+        self.history.prune_structured()
 
         final_response = ""
         iterations = 0
+        loop = asyncio.get_running_loop()
 
         try:
             while iterations < self.max_iterations:
                 iterations += 1
-                log.debug(f"Agent iteration {iterations}")
+                log.debug("Agent iteration %d", iterations)
 
                 # ── Think ─────────────────────────────────────────────────
-                accumulated_text = ""
+                text_parts: list[str] = []
                 tool_calls_received: list[ToolCall] = []
+                # Coalesce tiny stream chunks so the GUI gets fewer, larger updates
+                pending: list[str] = []
+                pending_len = 0
+                last_flush = loop.time()
 
                 async for chunk in self.backend.stream_chat(
                     messages=self.history.get_messages(),
                     tools=self.tools_manifest if self.tools_manifest else None,
                 ):
                     if isinstance(chunk, str):
-                        accumulated_text += chunk
-                        yield TextChunkEvent(chunk)
+                        text_parts.append(chunk)
+                        pending.append(chunk)
+                        pending_len += len(chunk)
+                        now = loop.time()
+                        if pending_len >= _FLUSH_CHARS or now - last_flush >= _FLUSH_INTERVAL:
+                            yield TextChunkEvent("".join(pending))
+                            pending.clear()
+                            pending_len = 0
+                            last_flush = now
                     elif isinstance(chunk, ToolCall):
                         tool_calls_received.append(chunk)
+                if pending:
+                    yield TextChunkEvent("".join(pending))
+                accumulated_text = "".join(text_parts)
 
                 # If no tool calls streamed, do a non-streaming call to get them
                 if not tool_calls_received and accumulated_text:
@@ -127,18 +173,23 @@ class RedTeamAgent:
                         {
                             "id": tc.id,
                             "type": "function",
-                            "function": {"name": tc.name, "arguments": json.dumps(tc.arguments)},
+                            "function": {"name": tc.name, "arguments": tc.arguments},
                         }
                         for tc in tool_calls_received
                     ]
                     self.history.add_assistant(accumulated_text, tool_calls=tc_dicts)
 
                     # ── Act ───────────────────────────────────────────────
+                    # Confirmations are resolved one at a time, then every
+                    # approved call runs concurrently on the tool pool
+                    approved: list[ToolCall] = []
                     for tc in tool_calls_received:
+                        if tc.name == PRUNE_CONTEXT_TOOL:
+                            continue
                         yield ToolCallEvent(tool_name=tc.name, arguments=tc.arguments, call_id=tc.id)
 
                         # Confirmation gate for dangerous tools
-                        if self.require_confirm and tc.name in DANGEROUS_TOOLS:
+                        if tc.name in self._needs_confirm:
                             cmd_preview = self._format_cmd_preview(tc.name, tc.arguments)
                             confirm_evt = ConfirmationRequiredEvent(
                                 tool_name=tc.name,
@@ -149,24 +200,46 @@ class RedTeamAgent:
                             # Wait for GUI to set the confirm_event
                             await confirm_evt.confirm_event.wait()
                             if not confirm_evt.confirmed:
-                                self.history.add_tool_result(tc.id, tc.name, "User cancelled execution.")
-                                yield ToolResultEvent(tc.name, tc.id, "User cancelled execution.", error=True)
                                 continue
+                        approved.append(tc)
 
-                        # Execute tool
-                        try:
-                            result = await asyncio.get_running_loop().run_in_executor(
-                                None, lambda n=tc.name, a=tc.arguments: self.tool_executor(n, a)
+                    results = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(
+                                _TOOL_POOL, functools.partial(self.tool_executor, tc.name, tc.arguments)
                             )
-                            output = str(result)
-                        except Exception as e:
-                            output = f"Tool error: {e}"
-                            yield ToolResultEvent(tc.name, tc.id, output, error=True)
-                            self.history.add_tool_result(tc.id, tc.name, output)
+                            for tc in approved
+                        ),
+                        return_exceptions=True,
+                    )
+                    outcomes = {id(tc): result for tc, result in zip(approved, results)}
+
+                    # Report results in the order the model requested them
+                    prune_ids: set[str] = set()
+                    for tc in tool_calls_received:
+                        if tc.name == PRUNE_CONTEXT_TOOL:
+                            # Housekeeping: no GUI events, applied after this turn's results
+                            memory = str(tc.arguments.get("memory", ""))
+                            prune_ids.update(str(i) for i in tc.arguments.get("delete_ids") or ())
+                            self.history.add_tool_result(tc.id, tc.name, f"Context pruned. Memory: {memory}")
                             continue
-
-                        yield ToolResultEvent(tc.name, tc.id, output)
+                        if id(tc) not in outcomes:
+                            output, error = "User cancelled execution.", True
+                        else:
+                            result = outcomes[id(tc)]
+                            if isinstance(result, Exception):
+                                output, error = f"Tool error: {result}", True
+                            else:
+                                output, error = str(result), False
+                        yield ToolResultEvent(tc.name, tc.id, output, error=error)
                         self.history.add_tool_result(tc.id, tc.name, output)
+                    if prune_ids:
+                        # Never delete the prune_context calls themselves: they carry the memory
+                        prune_ids.difference_update(
+                            tc.id for tc in tool_calls_received if tc.name == PRUNE_CONTEXT_TOOL
+                        )
+                        removed = self.history.delete_by_tool_call_ids(prune_ids)
+                        log.debug("prune_context removed %d messages", removed)
 
                 else:
                     # No tool calls — we're done
@@ -188,5 +261,11 @@ class RedTeamAgent:
 
     def _format_cmd_preview(self, tool_name: str, args: dict) -> str:
         """Format a human-readable command preview for confirmation."""
-        arg_str = " ".join(f"{k}={v!r}" for k, v in args.items())
-        return f"{tool_name}({arg_str})"
+        parts = []
+        for k, v in args.items():
+            # Slice long strings before repr so huge payloads are never fully formatted
+            text = repr(v[:_PREVIEW_ARG_MAX]) if isinstance(v, str) else repr(v)
+            if len(text) > _PREVIEW_ARG_MAX or (isinstance(v, str) and len(v) > _PREVIEW_ARG_MAX):
+                text = text[:_PREVIEW_ARG_MAX - 3] + "..."
+            parts.append(f"{k}={text}")
+        return f"{tool_name}({' '.join(parts)})"
@@ -1,7 +1,6 @@
 """Anthropic (Claude) backend."""
 from __future__ import annotations
-import json
-import uuid
+import asyncio
 from typing import AsyncIterator
 from redteamai.ai.base import AIBackend, AIResponse, ToolCall
 from redteamai.utils.logger import get_logger
@@ -15,6 +14,19 @@ class AnthropicBackend(AIBackend):
         self._model = model
         self._timeout = timeout
         self._max_tokens = max_tokens
+        # Resolve the optional SDK once; a missing package surfaces on first use
+        try:
+            import anthropic
+        except ImportError:
+            anthropic = None
+        self._sdk = anthropic
+        self._client = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # Conversion caches: source tools list -> Anthropic tools, and
+        # id(message) -> (message, converted entry) from the previous call
+        self._tools_src: list[dict] | None = None
+        self._tools_converted: list[dict] = []
+        self._msg_memo: dict[int, tuple[dict, dict]] = {}
 
     @property
     def name(self) -> str:
@@ -25,15 +37,27 @@ class AnthropicBackend(AIBackend):
         return self._model
 
     def _get_client(self):
-        try:
-            import anthropic
-            return anthropic.AsyncAnthropic(api_key=self._api_key)
-        except ImportError:
+        """Return the shared client, recreating it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+        if self._sdk is None:
             raise RuntimeError("anthropic package not installed. Run: pip install anthropic")
+        self._client = self._sdk.AsyncAnthropic(api_key=self._api_key)
+        self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.close()
+        self._client = None
+        self._client_loop = None
 
     async def health_check(self) -> tuple[bool, str]:
         if not self._api_key:
             return False, "No Anthropic API key configured"
+        if self._sdk is None:
+            return False, "anthropic package not installed. Run: pip install anthropic"
         try:
             client = self._get_client()
             r = await client.messages.create(
@@ -45,8 +69,14 @@ class AnthropicBackend(AIBackend):
         except Exception as e:
             return False, f"Anthropic error: {e}"
 
+    def set_tools(self, tools: list[dict] | None) -> None:
+        if tools:
+            self._convert_tools(tools)
+
     def _convert_tools(self, tools: list[dict]) -> list[dict]:
-        """Convert OpenAI-style tools to Anthropic format."""
+        """Convert OpenAI-style tools to Anthropic format (cached per tools list)."""
+        if tools is self._tools_src:
+            return self._tools_converted
         converted = []
         for t in tools:
             if t.get("type") == "function":
@@ -56,41 +86,57 @@ class AnthropicBackend(AIBackend):
                     "description": fn.get("description", ""),
                     "input_schema": fn.get("parameters", {"type": "object", "properties": {}}),
                 })
+        self._tools_src = tools
+        self._tools_converted = converted
         return converted
 
     def _convert_messages(self, messages: list[dict]) -> tuple[str | None, list[dict]]:
-        """Split system prompt and convert messages to Anthropic format."""
+        """Split system prompt and convert messages to Anthropic format.
+
+        Converted entries are memoized per message object, so each ReAct
+        iteration only converts the messages appended since the last call.
+        """
         system = None
         converted = []
+        memo: dict[int, tuple[dict, dict]] = {}
+        prev = self._msg_memo
         for msg in messages:
-            role = msg["role"]
-            if role == "system":
+            if msg["role"] == "system":
                 system = msg["content"]
-            elif role == "tool":
-                converted.append({
-                    "role": "user",
-                    "content": [{
-                        "type": "tool_result",
-                        "tool_use_id": msg.get("tool_call_id", ""),
-                        "content": str(msg["content"]),
-                    }]
-                })
-            elif role == "assistant" and msg.get("tool_calls"):
-                content = []
-                if msg.get("content"):
-                    content.append({"type": "text", "text": msg["content"]})
-                for tc in msg["tool_calls"]:
-                    content.append({
-                        "type": "tool_use",
-                        "id": tc["id"],
-                        "name": tc["function"]["name"],
-                        "input": json.loads(tc["function"]["arguments"]) if isinstance(tc["function"]["arguments"], str) else tc["function"]["arguments"],
-                    })
-                converted.append({"role": "assistant", "content": content})
-            else:
-                converted.append({"role": role, "content": msg["content"]})
+                continue
+            hit = prev.get(id(msg))
+            entry = hit[1] if hit is not None and hit[0] is msg else self._convert_message(msg)
+            memo[id(msg)] = (msg, entry)
+            converted.append(entry)
+        self._msg_memo = memo
         return system, converted
 
+    @staticmethod
+    def _convert_message(msg: dict) -> dict:
+        role = msg["role"]
+        if role == "tool":
+            return {
+                "role": "user",
+                "content": [{
+                    "type": "tool_result",
+                    "tool_use_id": msg.get("tool_call_id", ""),
+                    "content": str(msg["content"]),
+                }]
+            }
+        if role == "assistant" and msg.get("tool_calls"):
+            content = []
+            if msg.get("content"):
+                content.append({"type": "text", "text": msg["content"]})
+            for tc in msg["tool_calls"]:
+                content.append({
+                    "type": "tool_use",
+                    "id": tc["id"],
+                    "name": tc["function"]["name"],
+                    "input": tc["function"]["arguments"],
+                })
+            return {"role": "assistant", "content": content}
+        return {"role": role, "content": msg["content"]}
+
     async def chat(self, messages: list[dict], tools: list[dict] | None = None, *, stream: bool = False) -> AIResponse:
         client = self._get_client()
         system, converted = self._convert_messages(messages)
@@ -1,10 +1,19 @@
 """Instantiate AI backend from application settings."""
 from __future__ import annotations
 from redteamai.ai.base import AIBackend
+from redteamai.ai.response_cache import CachingBackend
 from redteamai.config.settings import AppSettings
 
 
 def create_backend(settings: AppSettings) -> AIBackend:
+    """Build the configured backend, wrapped in the response cache if enabled."""
+    instance = _build_backend(settings)
+    if settings.response_cache_enabled:
+        instance = CachingBackend(instance)
+    return instance
+
+
+def _build_backend(settings: AppSettings) -> AIBackend:
     backend = settings.ai_backend
 
     if backend == "ollama":
@@ -1,18 +1,30 @@
 """Abstract base classes for AI backends."""
 from __future__ import annotations
+import itertools
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Optional
 
 
-@dataclass
+# Tool-call ids only need to be unique within a conversation
+_TOOL_CALL_PREFIX = f"call_{os.getpid():x}_"
+_tool_call_counter = itertools.count()
+
+
+def new_tool_call_id() -> str:
+    """Return a cheap process-unique id for tool calls the provider left unnamed."""
+    return f"{_TOOL_CALL_PREFIX}{next(_tool_call_counter):x}"
+
+
+@dataclass(slots=True)
 class ToolCall:
     id: str
     name: str
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     content: str
     tool_calls: list[ToolCall] = field(default_factory=list)
@@ -46,6 +58,12 @@ class AIBackend(ABC):
     async def health_check(self) -> tuple[bool, str]:
         """Return (healthy, status_message)."""
 
+    def set_tools(self, tools: list[dict] | None) -> None:
+        """Pre-convert a tools manifest reused across calls (no-op by default)."""
+
+    async def aclose(self) -> None:
+        """Release network clients held by the backend (no-op by default)."""
+
     @property
     @abstractmethod
     def name(self) -> str:
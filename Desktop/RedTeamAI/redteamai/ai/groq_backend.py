@@ -1,11 +1,12 @@
 """Groq backend (free tier, fast inference)."""
 from __future__ import annotations
-import json
-import uuid
+import asyncio
 from typing import AsyncIterator
 import httpx
 from redteamai.ai.base import AIBackend, AIResponse, ToolCall
+from redteamai.ai.openai_compat_backend import iter_sse_data, parse_tool_calls, to_wire_messages
 from redteamai.utils.logger import get_logger
+from redteamai.utils import fastjson
 
 log = get_logger(__name__)
 GROQ_BASE = "https://api.groq.com/openai/v1"
@@ -16,6 +17,8 @@ class GroqBackend(AIBackend):
         self._api_key = api_key
         self._model = model
         self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def name(self) -> str:
@@ -28,63 +31,74 @@ class GroqBackend(AIBackend):
     def _headers(self) -> dict:
         return {"Authorization": f"Bearer {self._api_key}", "Content-Type": "application/json"}
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, recreating it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self._timeout, headers=self._headers())
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
     async def health_check(self) -> tuple[bool, str]:
         if not self._api_key:
             return False, "No Groq API key configured"
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                r = await client.get(f"{GROQ_BASE}/models", headers=self._headers())
-                if r.status_code == 200:
-                    return True, f"Groq OK - model: {self._model}"
-                return False, f"Groq returned HTTP {r.status_code}"
+            r = await self._get_client().get(f"{GROQ_BASE}/models", timeout=10)
+            if r.status_code == 200:
+                return True, f"Groq OK - model: {self._model}"
+            return False, f"Groq returned HTTP {r.status_code}"
         except Exception as e:
             return False, f"Groq not reachable: {e}"
 
     async def chat(self, messages: list[dict], tools: list[dict] | None = None, *, stream: bool = False) -> AIResponse:
-        payload: dict = {"model": self._model, "messages": messages, "stream": False}
+        payload: dict = {"model": self._model, "messages": to_wire_messages(messages), "stream": False}
         if tools:
             payload["tools"] = tools
             payload["tool_choice"] = "auto"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            r = await client.post(f"{GROQ_BASE}/chat/completions", json=payload, headers=self._headers())
-            r.raise_for_status()
-            data = r.json()
+        r = await self._get_client().post(f"{GROQ_BASE}/chat/completions", content=fastjson.dumps_bytes(payload))
+        r.raise_for_status()
+        data = fastjson.loads(r.content)
 
         choice = data["choices"][0]
         msg = choice["message"]
         content = msg.get("content") or ""
         raw_tcs = msg.get("tool_calls") or []
-        tool_calls = [
-            ToolCall(
-                id=tc.get("id", str(uuid.uuid4())),
-                name=tc["function"]["name"],
-                arguments=json.loads(tc["function"]["arguments"]) if isinstance(tc["function"]["arguments"], str) else tc["function"]["arguments"],
-            )
-            for tc in raw_tcs
-        ]
+        tool_calls = parse_tool_calls(raw_tcs)
         return AIResponse(content=content, tool_calls=tool_calls, finish_reason=choice.get("finish_reason", "stop"), model=self._model)
 
     async def stream_chat(self, messages: list[dict], tools: list[dict] | None = None) -> AsyncIterator[str | ToolCall]:
-        payload: dict = {"model": self._model, "messages": messages, "stream": True}
+        payload: dict = {"model": self._model, "messages": to_wire_messages(messages), "stream": True}
         if tools:
             payload["tools"] = tools
             payload["tool_choice"] = "auto"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            async with client.stream("POST", f"{GROQ_BASE}/chat/completions", json=payload, headers=self._headers()) as r:
-                r.raise_for_status()
-                async for line in r.aiter_lines():
-                    if not line.startswith("data: "):
-                        continue
-                    raw = line[6:]
-                    if raw == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(raw)
-                    except json.JSONDecodeError:
-                        continue
-                    delta = chunk["choices"][0].get("delta", {})
-                    token = delta.get("content") or ""
-                    if token:
-                        yield token
+        async with self._get_client().stream("POST", f"{GROQ_BASE}/chat/completions", content=fastjson.dumps_bytes(payload)) as r:
+            r.raise_for_status()
+            async for raw in iter_sse_data(r):
+                if raw == b"[DONE]":
+                    break
+                # Role-only and finish chunks carry no text; skip parsing them
+                if b'"content"' not in raw:
+                    continue
+                try:
+                    token = _delta_content(fastjson.loads(raw))
+                except ValueError:
+                    continue
+                if token:
+                    yield token
+
+
+def _delta_content(chunk: dict) -> str:
+    """Return choices[0].delta.content from a stream chunk, or ''."""
+    try:
+        return chunk["choices"][0]["delta"]["content"] or ""
+    except (KeyError, IndexError, TypeError):
+        return ""
+
@@ -1,7 +1,57 @@
 """Message history management with token pruning."""
 from __future__ import annotations
+import threading
 from dataclasses import dataclass, field
 from typing import Any
+from redteamai.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+_ENCODING = "cl100k_base"
+_encoder: Any = None
+_encoder_requested = False
+
+
+def _load_encoder() -> None:
+    global _encoder
+    try:
+        import tiktoken
+        _encoder = tiktoken.get_encoding(_ENCODING)
+    except Exception:  # Not installed, or the BPE file can't be fetched offline
+        log.debug("tiktoken unavailable; using the chars/4 token estimate")
+
+
+def _get_encoder() -> Any:
+    """Return a tiktoken encoder, or None to use the ~4 chars/token heuristic.
+
+    The first call starts loading the encoder on a background thread, since
+    tiktoken downloads its BPE file when it isn't cached; the heuristic is
+    used until it is ready.
+    """
+    global _encoder_requested
+    if not _encoder_requested:
+        _encoder_requested = True
+        threading.Thread(target=_load_encoder, name="tiktoken-load", daemon=True).start()
+    return _encoder
+
+
+def _count_tokens(text: str) -> int:
+    enc = _get_encoder()
+    if enc is None:
+        return len(text) // 4
+    return len(enc.encode(text, disallowed_special=()))
+
+
+_EVICTED_PREFIX = "[evicted: "
+_ARCHIVED = "[archived]"
+
+
+def _evicted_stub(msg: dict[str, Any]) -> str:
+    return f"{_EVICTED_PREFIX}{len(str(msg.get('content', '')))} bytes]"
+
+
+def _cleared_text(msg: dict[str, Any]) -> str:
+    return "" if msg.get("tool_calls") else _ARCHIVED
 
 
 @dataclass
@@ -10,53 +60,201 @@ class MessageHistory:
     max_tokens: int = 8000
     system_prompt: str = ""
     messages: list[dict[str, Any]] = field(default_factory=list)
+    # Token estimate per message, parallel to `messages` (filled at append time)
+    _tokens: list[int] = field(default_factory=list, init=False, repr=False)
+    # Cached system-prefixed view returned by get_messages()
+    _view: list[dict] | None = field(default=None, init=False, repr=False)
+    _view_system: str = field(default="", init=False, repr=False)
+    # Token count of system_prompt, keyed by the prompt string it was computed for
+    _system_tokens: tuple[str, int] = field(default=("", 0), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._tokens = self._count_all(self.messages)
 
     def add_user(self, content: str) -> None:
-        self.messages.append({"role": "user", "content": content})
+        self._append({"role": "user", "content": content})
 
     def add_assistant(self, content: str, tool_calls: list[dict] | None = None) -> None:
         msg: dict[str, Any] = {"role": "assistant", "content": content}
         if tool_calls:
             msg["tool_calls"] = tool_calls
-        self.messages.append(msg)
+        self._append(msg)
 
     def add_tool_result(self, tool_call_id: str, tool_name: str, content: str) -> None:
-        self.messages.append({
+        self._append({
             "role": "tool",
             "tool_call_id": tool_call_id,
             "name": tool_name,
             "content": content[:4000],  # Truncate very long tool outputs
         })
 
+    def _append(self, msg: dict[str, Any]) -> None:
+        self._sync_tokens()
+        self.messages.append(msg)
+        self._tokens.append(self._msg_tokens(msg))
+        self._view = None
+
     def get_messages(self) -> list[dict]:
-        """Return messages with system prompt prepended."""
-        msgs = []
-        if self.system_prompt:
-            msgs.append({"role": "system", "content": self.system_prompt})
-        msgs.extend(self.messages)
-        return msgs
+        """Return messages with system prompt prepended.
+
+        The list is cached until the history or system prompt changes;
+        callers must treat it as read-only.
+        """
+        view = self._view
+        if (
+            view is None
+            or self._view_system is not self.system_prompt
+            or len(view) != len(self.messages) + bool(self.system_prompt)
+        ):
+            view = []
+            if self.system_prompt:
+                view.append({"role": "system", "content": self.system_prompt})
+            view.extend(self.messages)
+            self._view = view
+            self._view_system = self.system_prompt
+        return view
 
     def prune(self) -> None:
         """Remove oldest non-system messages if estimated token count exceeds limit."""
-        # Simple heuristic: ~4 chars per token
-        while self._estimate_tokens() > self.max_tokens and len(self.messages) > 2:
-            # Always keep the last user message
-            self.messages.pop(0)
+        # Simple heuristic: ~4 chars per token. Drop the whole over-budget
+        # prefix in a single slice.
+        self._sync_tokens()
+        total = self._estimate_tokens()
+        k = 0
+        # Always keep the last two messages (the latest user turn)
+        while total > self.max_tokens and len(self._tokens) - k > 2:
+            total -= self._tokens[k]
+            k += 1
+        if k:
+            # Cut on a user turn: a leading tool result whose assistant
+            # tool_calls were dropped is rejected by every provider
+            msgs = self.messages
+            cut = next((i for i in range(k, len(msgs)) if msgs[i].get("role") == "user"), None)
+            if cut is None:
+                cut = k
+                while cut < len(msgs) and msgs[cut].get("role") == "tool":
+                    cut += 1
+            k = cut
+            self.messages = self.messages[k:]
+            self._tokens = self._tokens[k:]
+            self._view = None
+
+    def prune_structured(self) -> None:
+        """Shrink old message payloads in place before dropping any messages.
+
+        Message positions are kept, so the conversation prefix seen by the
+        provider changes as little as possible. Phases run in order and stop
+        once the history fits in max_tokens:
+
+        1. Old tool results (before the last 2 user turns) become a size stub.
+        2. Assistant text older than the last 3 assistant messages is cleared
+           when tool_calls remain (keeping tool results paired), otherwise
+           archived, since providers reject empty assistant content.
+        3. Anything older than the last 10 messages is archived.
+        4. Fall back to prune(), which drops the oldest messages.
+        """
+        self._sync_tokens()
+        total = self._estimate_tokens()
+        if total <= self.max_tokens:
+            return
+        msgs = self.messages
+
+        user_idx = [i for i, m in enumerate(msgs) if m.get("role") == "user"]
+        turn_cutoff = user_idx[-2] if len(user_idx) >= 2 else 0
+        asst_idx = [i for i, m in enumerate(msgs) if m.get("role") == "assistant"]
+        asst_cutoff = asst_idx[-3] if len(asst_idx) >= 3 else 0
+        phases = (
+            (turn_cutoff, lambda m: m.get("role") == "tool", _evicted_stub),
+            (asst_cutoff, lambda m: m.get("role") == "assistant", _cleared_text),
+            (len(msgs) - 10, lambda m: True, lambda m: _ARCHIVED),
+        )
+        for cutoff, match, replace in phases:
+            for i in range(max(cutoff, 0)):
+                msg = msgs[i]
+                content = msg.get("content")
+                if not content or content == _ARCHIVED or not match(msg):
+                    continue
+                if isinstance(content, str) and content.startswith(_EVICTED_PREFIX):
+                    continue
+                # Replace rather than mutate: backends memoize by message identity
+                new_msg = {**msg, "content": replace(msg)}
+                msgs[i] = new_msg
+                tokens = self._msg_tokens(new_msg)
+                total -= self._tokens[i] - tokens
+                self._tokens[i] = tokens
+                self._view = None
+            if total <= self.max_tokens:
+                return
+        self.prune()
+
+    def delete_by_tool_call_ids(self, ids: set[str]) -> int:
+        """Drop the given tool calls and their results; return messages removed.
+
+        Assistant messages keep their remaining tool_calls, and are removed
+        only when nothing (text or calls) is left.
+        """
+        if not ids:
+            return 0
+        self._sync_tokens()
+        kept: list[dict[str, Any]] = []
+        kept_tokens: list[int] = []
+        for msg, tokens in zip(self.messages, self._tokens):
+            if msg.get("role") == "tool" and msg.get("tool_call_id") in ids:
+                continue
+            calls = msg.get("tool_calls")
+            if calls and any(tc.get("id") in ids for tc in calls):
+                remaining = [tc for tc in calls if tc.get("id") not in ids]
+                if not remaining and not msg.get("content"):
+                    continue
+                msg = {k: v for k, v in msg.items() if k != "tool_calls"}
+                if remaining:
+                    msg["tool_calls"] = remaining
+            kept.append(msg)
+            kept_tokens.append(tokens)
+        removed = len(self.messages) - len(kept)
+        self.messages = kept
+        self._tokens = kept_tokens
+        self._view = None
+        return removed
 
     def _estimate_tokens(self) -> int:
-        total = len(self.system_prompt) // 4
-        for msg in self.messages:
-            content = msg.get("content", "")
-            if isinstance(content, str):
-                total += len(content) // 4
-            elif isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict):
-                        total += len(str(block)) // 4
-        return total
+        self._sync_tokens()
+        src, count = self._system_tokens
+        if src is not self.system_prompt:
+            count = _count_tokens(self.system_prompt)
+            self._system_tokens = (self.system_prompt, count)
+        return count + sum(self._tokens)
+
+    def _sync_tokens(self) -> None:
+        # Recover if `messages` was mutated directly instead of via add_*()
+        if len(self._tokens) != len(self.messages):
+            self._tokens = self._count_all(self.messages)
+
+    @staticmethod
+    def _msg_text(msg: dict[str, Any]) -> str:
+        content = msg.get("content", "")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return "".join(str(block) for block in content if isinstance(block, dict))
+        return ""
+
+    @classmethod
+    def _msg_tokens(cls, msg: dict[str, Any]) -> int:
+        return _count_tokens(cls._msg_text(msg))
+
+    @classmethod
+    def _count_all(cls, messages: list[dict[str, Any]]) -> list[int]:
+        texts = [cls._msg_text(m) for m in messages]
+        enc = _get_encoder()
+        if enc is None:
+            return [len(t) // 4 for t in texts]
+        return [len(ids) for ids in enc.encode_batch(texts, disallowed_special=())]
 
     def clear(self) -> None:
         self.messages.clear()
+        self._tokens.clear()
+        self._view = None
 
     def __len__(self) -> int:
         return len(self.messages)
@@ -1,15 +1,16 @@
 """Ollama backend via /api/chat (native Ollama endpoint, supports local and cloud models)."""
 from __future__ import annotations
-import json
-import re
-import uuid
 import asyncio
 from typing import AsyncIterator, Any
 import httpx
-from redteamai.ai.base import AIBackend, AIResponse, ToolCall
+from redteamai.ai.base import AIBackend, AIResponse, ToolCall, new_tool_call_id
+from redteamai.ai.openai_compat_backend import parse_tool_calls
 from redteamai.utils.logger import get_logger
+from redteamai.utils import fastjson
 
 log = get_logger(__name__)
+_TC_OPEN = "<tool_call>"
+_TC_CLOSE = "</tool_call>"
 
 
 class OllamaBackend(AIBackend):
@@ -18,6 +19,10 @@ class OllamaBackend(AIBackend):
         self._model = model
         self._timeout = timeout
         self._use_xml_fallback = use_xml_fallback
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # id(message) -> (message, normalized copy) from the previous call
+        self._norm_memo: dict[int, tuple[dict, dict]] = {}
 
     @property
     def name(self) -> str:
@@ -27,54 +32,82 @@ class OllamaBackend(AIBackend):
     def model(self) -> str:
         return self._model
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, recreating it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout, headers={"Content-Type": "application/json"}
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
     async def health_check(self) -> tuple[bool, str]:
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                r = await client.get(f"{self._host}/api/tags")
-                if r.status_code == 200:
-                    data = r.json()
-                    models = [m["name"] for m in data.get("models", [])]
-                    if self._model in models or any(self._model in m for m in models):
-                        return True, f"Ollama OK - {self._model} available"
-                    return True, f"Ollama running but model '{self._model}' not pulled. Run: ollama pull {self._model}"
+            r = await self._get_client().get(f"{self._host}/api/tags", timeout=5)
+            if r.status_code == 200:
+                data = fastjson.loads(r.content)
+                models = [m["name"] for m in data.get("models", [])]
+                if self._model in models or any(self._model in m for m in models):
+                    return True, f"Ollama OK - {self._model} available"
+                return True, f"Ollama running but model '{self._model}' not pulled. Run: ollama pull {self._model}"
         except Exception as e:
             return False, f"Ollama not reachable at {self._host}: {e}"
         return False, "Unexpected response from Ollama"
 
-    @staticmethod
-    def _normalize_messages(messages: list[dict]) -> list[dict]:
+    def _normalize_messages(self, messages: list[dict]) -> list[dict]:
         """Convert OpenAI-format messages to Ollama native /api/chat format.
 
         Key differences:
         - tool_calls arguments must be a dict, not a JSON string
         - tool_calls must not have 'type' key
         - tool result messages must not have 'tool_call_id' or 'name'
+
+        Results are memoized per message object, so each agent iteration
+        only normalizes the messages added since the previous call.
         """
         out = []
+        memo: dict[int, tuple[dict, dict]] = {}
+        prev = self._norm_memo
         for msg in messages:
-            msg = dict(msg)
-            if msg.get("role") == "assistant" and msg.get("tool_calls"):
-                normalized_calls = []
-                for tc in msg["tool_calls"]:
-                    tc = dict(tc)
-                    tc.pop("type", None)
-                    fn = dict(tc.get("function", {}))
-                    args = fn.get("arguments", {})
-                    if isinstance(args, str):
-                        try:
-                            args = json.loads(args)
-                        except json.JSONDecodeError:
-                            args = {}
-                    fn["arguments"] = args
-                    tc["function"] = fn
-                    normalized_calls.append(tc)
-                msg["tool_calls"] = normalized_calls
-            elif msg.get("role") == "tool":
-                msg.pop("tool_call_id", None)
-                msg.pop("name", None)
-            out.append(msg)
+            hit = prev.get(id(msg))
+            entry = hit[1] if hit is not None and hit[0] is msg else self._normalize_message(msg)
+            memo[id(msg)] = (msg, entry)
+            out.append(entry)
+        self._norm_memo = memo
         return out
 
+    @staticmethod
+    def _normalize_message(msg: dict) -> dict:
+        """Return msg in Ollama form, copying only when something must change."""
+        role = msg.get("role")
+        if role == "assistant" and msg.get("tool_calls"):
+            normalized_calls = []
+            for tc in msg["tool_calls"]:
+                tc = dict(tc)
+                tc.pop("type", None)
+                fn = dict(tc.get("function", {}))
+                args = fn.get("arguments", {})
+                if isinstance(args, str):
+                    try:
+                        args = fastjson.loads(args)
+                    except fastjson.JSONDecodeError:
+                        args = {}
+                fn["arguments"] = args
+                tc["function"] = fn
+                normalized_calls.append(tc)
+            return {**msg, "tool_calls": normalized_calls}
+        if role == "tool" and ("tool_call_id" in msg or "name" in msg):
+            return {k: v for k, v in msg.items() if k not in ("tool_call_id", "name")}
+        # Plain messages are shared as-is; the payload is only serialized, never mutated
+        return msg
+
     async def chat(self, messages: list[dict], tools: list[dict] | None = None, *, stream: bool = False) -> AIResponse:
         payload = {
             "model": self._model,
@@ -85,10 +118,9 @@ class OllamaBackend(AIBackend):
             payload["tools"] = tools
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                r = await client.post(f"{self._host}/api/chat", json=payload)
-                r.raise_for_status()
-                data = r.json()
+            r = await self._get_client().post(f"{self._host}/api/chat", content=fastjson.dumps_bytes(payload))
+            r.raise_for_status()
+            data = fastjson.loads(r.content)
         except httpx.HTTPError as e:
             raise RuntimeError(f"Ollama request failed: {e}") from e
 
@@ -96,14 +128,8 @@ class OllamaBackend(AIBackend):
         content = msg.get("content") or ""
         raw_tool_calls = msg.get("tool_calls") or []
 
-        tool_calls = [
-            ToolCall(
-                id=str(uuid.uuid4()),
-                name=tc["function"]["name"],
-                arguments=tc["function"]["arguments"] if isinstance(tc["function"]["arguments"], dict) else json.loads(tc["function"]["arguments"]),
-            )
-            for tc in raw_tool_calls
-        ]
+        # Usually dict arguments, but some models/versions send JSON strings
+        tool_calls = parse_tool_calls(raw_tool_calls)
 
         # XML fallback for models without native tool calling
         if not tool_calls and tools and self._use_xml_fallback and content:
@@ -120,64 +146,86 @@ class OllamaBackend(AIBackend):
     async def stream_chat(self, messages: list[dict], tools: list[dict] | None = None) -> AsyncIterator[str | ToolCall]:
         payload = {
             "model": self._model,
-            "messages": messages,
+            "messages": self._normalize_messages(messages),
             "stream": True,
         }
         if tools:
             payload["tools"] = tools
 
-        payload["messages"] = self._normalize_messages(payload["messages"])
-        full_content = ""
+        # Text is only kept when the XML tool-call fallback will scan it
+        xml_fallback = bool(tools) and self._use_xml_fallback
+        content_parts: list[str] = []
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                async with client.stream("POST", f"{self._host}/api/chat", json=payload) as r:
-                    r.raise_for_status()
-                    async for line in r.aiter_lines():
-                        if not line.strip():
-                            continue
-                        try:
-                            chunk = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-                        msg = chunk.get("message", {})
-                        token = msg.get("content") or ""
-                        if token:
-                            full_content += token
-                            yield token
-                        # Tool calls can arrive in any chunk (not just the done chunk)
-                        for tc_raw in (msg.get("tool_calls") or []):
-                            fn = tc_raw.get("function", {})
-                            args = fn.get("arguments", {})
-                            if isinstance(args, str):
-                                args = json.loads(args)
-                            yield ToolCall(
-                                id=tc_raw.get("id", str(uuid.uuid4())),
-                                name=fn.get("name", ""),
-                                arguments=args,
-                            )
+            async with self._get_client().stream("POST", f"{self._host}/api/chat", content=fastjson.dumps_bytes(payload)) as r:
+                r.raise_for_status()
+                async for line in _iter_ndjson(r):
+                    try:
+                        chunk = fastjson.loads(line)
+                    except ValueError:
+                        continue
+                    msg = chunk.get("message", {})
+                    token = msg.get("content") or ""
+                    if token:
+                        if xml_fallback:
+                            content_parts.append(token)
+                        yield token
+                    # Tool calls can arrive in any chunk (not just the done chunk)
+                    for tc_raw in (msg.get("tool_calls") or []):
+                        fn = tc_raw.get("function", {})
+                        args = fn.get("arguments", {})
+                        if isinstance(args, str):
+                            args = fastjson.loads(args)
+                        yield ToolCall(
+                            id=tc_raw.get("id") or new_tool_call_id(),
+                            name=fn.get("name", ""),
+                            arguments=args,
+                        )
         except httpx.HTTPError as e:
             raise RuntimeError(f"Ollama streaming failed: {e}") from e
 
         # XML fallback after full stream
-        if tools and self._use_xml_fallback and full_content:
-            for tc in _parse_xml_tool_calls(full_content):
+        if content_parts:
+            for tc in _parse_xml_tool_calls("".join(content_parts)):
                 yield tc
 
 
+async def _iter_ndjson(r: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield each non-empty NDJSON line as bytes, without decoding to str."""
+    buf = bytearray()
+    async for chunk in r.aiter_bytes():
+        buf.extend(chunk)
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            line = bytes(buf[start:end]).strip()
+            start = end + 1
+            if line:
+                yield line
+        del buf[:start]
+    line = bytes(buf).strip()
+    if line:
+        yield line
+
+
 def _parse_xml_tool_calls(content: str) -> list[ToolCall]:
     """Fallback: parse <tool_call>{"name": ..., "arguments": ...}</tool_call> tags."""
-    pattern = re.compile(r'<tool_call>(.*?)</tool_call>', re.DOTALL)
     tool_calls = []
-    for m in pattern.finditer(content):
+    i = 0
+    while (start := content.find(_TC_OPEN, i)) != -1:
+        body_start = start + len(_TC_OPEN)
+        end = content.find(_TC_CLOSE, body_start)
+        if end == -1:
+            break
+        i = end + len(_TC_CLOSE)
         try:
-            data = json.loads(m.group(1).strip())
+            # JSON parsers skip surrounding whitespace, so no strip() copy
+            data = fastjson.loads(content[body_start:end])
             tc = ToolCall(
-                id=str(uuid.uuid4()),
+                id=new_tool_call_id(),
                 name=data.get("name", ""),
                 arguments=data.get("arguments", data.get("parameters", {})),
             )
             if tc.name:
                 tool_calls.append(tc)
-        except (json.JSONDecodeError, KeyError):
+        except (fastjson.JSONDecodeError, KeyError):
             continue
     return tool_calls
@@ -1,13 +1,81 @@
 """OpenAI-compatible backend (any endpoint: OpenAI, LM Studio, Together, etc.)."""
 from __future__ import annotations
-import json
-import uuid
+import asyncio
 from typing import AsyncIterator
 import httpx
-from redteamai.ai.base import AIBackend, AIResponse, ToolCall
+from redteamai.ai.base import AIBackend, AIResponse, ToolCall, new_tool_call_id
 from redteamai.utils.logger import get_logger
+from redteamai.utils import fastjson
 
 log = get_logger(__name__)
+# stream_chat flushes buffered tokens every _FLUSH_TOKENS tokens or _FLUSH_INTERVAL seconds
+_FLUSH_TOKENS = 8
+_FLUSH_INTERVAL = 0.016
+
+
+def to_wire_messages(messages: list[dict]) -> list[dict]:
+    """Serialize dict tool-call arguments to the JSON strings the OpenAI protocol expects.
+
+    History keeps arguments as dicts; only messages carrying tool calls are copied.
+    """
+    out = messages
+    for i, msg in enumerate(messages):
+        if not msg.get("tool_calls"):
+            continue
+        if out is messages:
+            out = list(messages)
+        calls = []
+        for tc in msg["tool_calls"]:
+            fn = tc["function"]
+            args = fn.get("arguments", {})
+            if not isinstance(args, str):
+                tc = {**tc, "function": {**fn, "arguments": fastjson.dumps(args)}}
+            calls.append(tc)
+        out[i] = {**msg, "tool_calls": calls}
+    return out
+
+
+def parse_tool_calls(raw_tcs: list[dict]) -> list[ToolCall]:
+    """Build ToolCalls from a response's tool_calls list.
+
+    A provider sends either JSON-string or dict arguments for a whole
+    response, so the format is detected once from the first call.
+    """
+    if not raw_tcs:
+        return []
+    if isinstance(raw_tcs[0]["function"]["arguments"], str):
+        return [
+            ToolCall(
+                id=tc.get("id") or new_tool_call_id(),
+                name=tc["function"]["name"],
+                arguments=fastjson.loads(tc["function"]["arguments"]),
+            )
+            for tc in raw_tcs
+        ]
+    return [
+        ToolCall(
+            id=tc.get("id") or new_tool_call_id(),
+            name=tc["function"]["name"],
+            arguments=tc["function"]["arguments"],
+        )
+        for tc in raw_tcs
+    ]
+
+
+async def iter_sse_data(r: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the payload of each SSE 'data:' line, scanning raw byte chunks."""
+    buf = bytearray()
+    async for chunk in r.aiter_bytes(65536):
+        buf.extend(chunk)
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            line = bytes(buf[start:end]).rstrip(b"\r")
+            start = end + 1
+            if line.startswith(b"data:"):
+                yield line[5:].lstrip()
+        del buf[:start]
+    if buf.startswith(b"data:"):
+        yield bytes(buf[5:]).strip()
 
 
 class OpenAICompatBackend(AIBackend):
@@ -16,6 +84,8 @@ class OpenAICompatBackend(AIBackend):
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def name(self) -> str:
@@ -31,60 +101,74 @@ class OpenAICompatBackend(AIBackend):
             h["Authorization"] = f"Bearer {self._api_key}"
         return h
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, recreating it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self._timeout, headers=self._headers())
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
     async def health_check(self) -> tuple[bool, str]:
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                r = await client.get(f"{self._base_url}/models", headers=self._headers())
-                if r.status_code in (200, 401):  # 401 means reachable but needs auth
-                    return r.status_code == 200, f"OpenAI-compat OK - {self._model}"
-                return False, f"HTTP {r.status_code} from {self._base_url}"
+            r = await self._get_client().get(f"{self._base_url}/models", timeout=10)
+            if r.status_code in (200, 401):  # 401 means reachable but needs auth
+                return r.status_code == 200, f"OpenAI-compat OK - {self._model}"
+            return False, f"HTTP {r.status_code} from {self._base_url}"
         except Exception as e:
             return False, f"Not reachable: {e}"
 
     async def chat(self, messages: list[dict], tools: list[dict] | None = None, *, stream: bool = False) -> AIResponse:
-        payload: dict = {"model": self._model, "messages": messages, "stream": False}
+        payload: dict = {"model": self._model, "messages": to_wire_messages(messages), "stream": False}
         if tools:
             payload["tools"] = tools
             payload["tool_choice"] = "auto"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            r = await client.post(f"{self._base_url}/chat/completions", json=payload, headers=self._headers())
-            r.raise_for_status()
-            data = r.json()
+        r = await self._get_client().post(f"{self._base_url}/chat/completions", content=fastjson.dumps_bytes(payload))
+        r.raise_for_status()
+        data = fastjson.loads(r.content)
 
         choice = data["choices"][0]
         msg = choice["message"]
         content = msg.get("content") or ""
         raw_tcs = msg.get("tool_calls") or []
-        tool_calls = [
-            ToolCall(
-                id=tc.get("id", str(uuid.uuid4())),
-                name=tc["function"]["name"],
-                arguments=json.loads(tc["function"]["arguments"]) if isinstance(tc["function"]["arguments"], str) else tc["function"]["arguments"],
-            )
-            for tc in raw_tcs
-        ]
+        tool_calls = parse_tool_calls(raw_tcs)
         return AIResponse(content=content, tool_calls=tool_calls, finish_reason=choice.get("finish_reason", "stop"), model=self._model)
 
     async def stream_chat(self, messages: list[dict], tools: list[dict] | None = None) -> AsyncIterator[str | ToolCall]:
-        payload: dict = {"model": self._model, "messages": messages, "stream": True}
+        payload: dict = {"model": self._model, "messages": to_wire_messages(messages), "stream": True}
         if tools:
             payload["tools"] = tools
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            async with client.stream("POST", f"{self._base_url}/chat/completions", json=payload, headers=self._headers()) as r:
-                r.raise_for_status()
-                async for line in r.aiter_lines():
-                    if not line.startswith("data: "):
-                        continue
-                    raw = line[6:]
-                    if raw == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(raw)
-                    except json.JSONDecodeError:
-                        continue
-                    delta = chunk["choices"][0].get("delta", {})
-                    token = delta.get("content") or ""
-                    if token:
-                        yield token
+        async with self._get_client().stream("POST", f"{self._base_url}/chat/completions", content=fastjson.dumps_bytes(payload)) as r:
+            r.raise_for_status()
+            loop = asyncio.get_running_loop()
+            pending: list[str] = []
+            last_flush = loop.time()
+            async for raw in iter_sse_data(r):
+                if raw == b"[DONE]":
+                    break
+                if b'"content"' not in raw:
+                    continue
+                try:
+                    chunk = fastjson.loads(raw)
+                except ValueError:
+                    continue
+                delta = chunk["choices"][0].get("delta", {})
+                token = delta.get("content") or ""
+                if token:
+                    pending.append(token)
+                    now = loop.time()
+                    # Hand tokens on in small batches instead of one at a time
+                    if len(pending) >= _FLUSH_TOKENS or now - last_flush >= _FLUSH_INTERVAL:
+                        yield "".join(pending)
+                        pending.clear()
+                        last_flush = now
+            if pending:
+                yield "".join(pending)
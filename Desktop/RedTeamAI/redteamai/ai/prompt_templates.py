@@ -1,5 +1,6 @@
 """System prompts for each module and operating mode."""
 from __future__ import annotations
+from functools import lru_cache
 
 _BASE = """You are RedTeam AI, an expert AI assistant for authorized penetration testing, CTF competitions, and security research. You operate ONLY on systems the user owns or has written authorization to test.
 
@@ -50,8 +51,14 @@ Format findings by severity: Critical → High → Medium → Low → Info""",
 }
 
 
+@lru_cache(maxsize=128)
 def get_prompt(module: str = "default", context: str = "") -> str:
-    """Get system prompt for a module with optional context injection."""
+    """Get system prompt for a module with optional context injection.
+
+    Cached, so repeated calls return the same string object; MessageHistory
+    keys its system-prompt caches on that identity. Unknown module names
+    fall back to the default prompt.
+    """
     base = SYSTEM_PROMPTS.get(module, SYSTEM_PROMPTS["default"])
     if context:
         return f"{base}\n\nCurrent Context:\n{context}"
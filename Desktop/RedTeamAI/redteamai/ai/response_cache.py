@@ -0,0 +1,111 @@
+"""Exact-match response cache wrapped around any AI backend."""
+from __future__ import annotations
+import hashlib
+import time
+from collections import OrderedDict
+from typing import AsyncIterator
+from redteamai.ai.base import AIBackend, AIResponse, ToolCall
+from redteamai.utils import fastjson
+from redteamai.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Module-level so cached replies survive agent resets and backend rebuilds
+_MAX_ENTRIES = 512
+_TTL_SECONDS = 600.0
+_REPLAY_CHUNK = 64
+# key -> (expiry on the monotonic clock, response)
+_cache: OrderedDict[bytes, tuple[float, AIResponse]] = OrderedDict()
+
+
+def _cache_get(key: bytes) -> AIResponse | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_put(key: bytes, response: AIResponse) -> None:
+    _cache[key] = (time.monotonic() + _TTL_SECONDS, response)
+    _cache.move_to_end(key)
+    while len(_cache) > _MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def clear_response_cache() -> None:
+    _cache.clear()
+
+
+class CachingBackend(AIBackend):
+    """
+    Serves repeated identical requests from memory for up to 10 minutes.
+    Only plain-text replies are cached; responses with tool calls always
+    go to the model because executing them has side effects. chat() calls
+    with stream=True bypass the cache.
+    """
+
+    def __init__(self, inner: AIBackend):
+        self._inner = inner
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    @property
+    def model(self) -> str:
+        return self._inner.model
+
+    def set_tools(self, tools: list[dict] | None) -> None:
+        self._inner.set_tools(tools)
+
+    async def health_check(self) -> tuple[bool, str]:
+        return await self._inner.health_check()
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+    def _key(self, messages: list[dict], tools: list[dict] | None) -> bytes:
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{self._inner.name}\0{self._inner.model}\0".encode())
+        h.update(fastjson.dumps(messages).encode())
+        h.update(fastjson.dumps(tools or []).encode())
+        return h.digest()
+
+    async def chat(self, messages: list[dict], tools: list[dict] | None = None, *, stream: bool = False) -> AIResponse:
+        if stream:
+            return await self._inner.chat(messages, tools, stream=stream)
+        key = self._key(messages, tools)
+        cached = _cache_get(key)
+        if cached is not None:
+            log.debug("Response cache hit")
+            return cached
+        response = await self._inner.chat(messages, tools, stream=stream)
+        if not response.tool_calls:
+            _cache_put(key, response)
+        return response
+
+    async def stream_chat(self, messages: list[dict], tools: list[dict] | None = None) -> AsyncIterator[str | ToolCall]:
+        key = self._key(messages, tools)
+        cached = _cache_get(key)
+        if cached is not None:
+            log.debug("Response cache hit (stream replay)")
+            text = cached.content
+            for i in range(0, len(text), _REPLAY_CHUNK):
+                yield text[i:i + _REPLAY_CHUNK]
+            return
+
+        parts: list[str] = []
+        saw_tool_call = False
+        async for chunk in self._inner.stream_chat(messages, tools):
+            if isinstance(chunk, ToolCall):
+                saw_tool_call = True
+            else:
+                parts.append(chunk)
+            yield chunk
+        # Only reached when the stream was consumed to the end
+        if not saw_tool_call and parts:
+            _cache_put(key, AIResponse(content="".join(parts), model=self._inner.model))
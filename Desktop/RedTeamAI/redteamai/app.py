@@ -5,7 +5,7 @@ from typing import Optional
 from redteamai.config.settings import AppSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Singleton-like application state passed throughout the app."""
     settings: AppSettings = field(default_factory=AppSettings)
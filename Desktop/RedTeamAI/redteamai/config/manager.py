@@ -1,4 +1,4 @@
-"""Load/save config.toml using tomlkit for round-trip preservation."""
+"""Load/save config.toml (tomllib for reads where available, tomlkit for writes)."""
 from __future__ import annotations
 import tomlkit
 from pathlib import Path
@@ -6,6 +6,11 @@ from typing import Any
 from redteamai.constants import CONFIG_FILE, APP_DATA_DIR
 from redteamai.config.settings import AppSettings
 
+try:
+    import tomllib  # Python 3.11+: parses straight to plain dicts
+except ImportError:
+    tomllib = None
+
 
 def _deep_merge(base: dict, override: dict) -> dict:
     """Recursively merge override into base."""
@@ -24,9 +29,13 @@ def load_config() -> AppSettings:
 
     if CONFIG_FILE.exists():
         try:
-            raw = tomlkit.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-            # Convert tomlkit tables to plain dicts so pydantic can coerce nested models
-            plain = _toml_to_plain_dict(raw)
+            if tomllib is not None:
+                with open(CONFIG_FILE, "rb") as f:
+                    plain = tomllib.load(f)
+            else:
+                raw = tomlkit.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+                # Convert tomlkit tables to plain dicts so pydantic can coerce nested models
+                plain = _toml_to_plain_dict(raw)
             return AppSettings(**plain)
         except Exception:
             pass
@@ -78,6 +78,7 @@ class AppSettings(BaseSettings):
     # Agent
     max_agent_iterations: int = 10
     require_confirm_dangerous: bool = True
+    response_cache_enabled: bool = False  # Opt-in: reuse replies to identical text-only requests
     auto_save_session: bool = True
 
     # NVD API (free, no key needed for limited rate)
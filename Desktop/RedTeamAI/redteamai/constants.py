@@ -1,4 +1,7 @@
 """Application-wide constants: colors, paths, version."""
+import functools
+import os
+import sys
 from pathlib import Path
 
 # ── Version ──────────────────────────────────────────────────────────────────
@@ -8,22 +11,35 @@ APP_AUTHOR = "RedTeam AI Project"
 APP_URL = "https://github.com/your-org/redteamai"
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
-ROOT_DIR = Path(__file__).parent.parent
-ASSETS_DIR = ROOT_DIR / "assets"
-ICONS_DIR = ASSETS_DIR / "icons"
-FONTS_DIR = ASSETS_DIR / "fonts"
-STYLES_DIR = ROOT_DIR / "redteamai" / "gui" / "styles"
+# Built on first access (PEP 562 module __getattr__) and cached, so importing
+# constants for colors or defaults does no path work.
+@functools.cache
+def _paths() -> dict[str, Path]:
+    root = Path(__file__).parent.parent
+    assets = root / "assets"
+    if sys.platform == "win32":
+        data = Path(os.environ.get("APPDATA", Path.home())) / "RedTeamAI"
+    else:
+        data = Path.home() / ".local" / "share" / "RedTeamAI"
+    return {
+        "ROOT_DIR": root,
+        "ASSETS_DIR": assets,
+        "ICONS_DIR": assets / "icons",
+        "FONTS_DIR": assets / "fonts",
+        "STYLES_DIR": root / "redteamai" / "gui" / "styles",
+        "APP_DATA_DIR": data,
+        "CONFIG_FILE": data / "config.toml",
+        "DB_FILE": data / "redteamai.db",
+        "LOG_FILE": data / "redteamai.log",
+        "PROJECTS_DIR": data / "projects",
+    }
 
-import sys, os
-if sys.platform == "win32":
-    APP_DATA_DIR = Path(os.environ.get("APPDATA", Path.home())) / "RedTeamAI"
-else:
-    APP_DATA_DIR = Path.home() / ".local" / "share" / "RedTeamAI"
 
-CONFIG_FILE = APP_DATA_DIR / "config.toml"
-DB_FILE = APP_DATA_DIR / "redteamai.db"
-LOG_FILE = APP_DATA_DIR / "redteamai.log"
-PROJECTS_DIR = APP_DATA_DIR / "projects"
+def __getattr__(name: str) -> Path:
+    try:
+        return _paths()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
 # ── GitHub Dark Palette ───────────────────────────────────────────────────────
 COLOR_BG           = "#0d1117"   # Main window background
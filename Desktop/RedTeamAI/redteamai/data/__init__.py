@@ -1,3 +1,7 @@
-from redteamai.data.database import init_db, get_session, get_engine
+from redteamai.data.database import (
+    init_db, close_db, get_session, get_write_session, get_read_session, get_db, get_engine,
+)
 
-__all__ = ["init_db", "get_session", "get_engine"]
+__all__ = [
+    "init_db", "close_db", "get_session", "get_write_session", "get_read_session", "get_db", "get_engine",
+]
@@ -1,43 +1,224 @@
 """Database engine initialization and session factory."""
 from __future__ import annotations
+from contextlib import contextmanager
 from pathlib import Path
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, Session
-from redteamai.data.models import Base
+from typing import TYPE_CHECKING, Iterator
+from redteamai.utils import fastjson
 
+# SQLAlchemy and the ORM models are imported in init_db, so importing this
+# module (or redteamai.data) stays cheap until the database is first used
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
+
+# _engine serves read-write sessions; read-only sessions get their own pool
 _engine = None
+_read_engine = None
 _SessionLocal = None
+_ReadSessionLocal = None
+
+# Applied in order to every new connection. WAL with synchronous=NORMAL
+# only fsyncs at checkpoints, which is safe against app crashes.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",   # 256 MB
+    "PRAGMA cache_size=-20000",     # ~20 MB
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _add_pragma_listener(engine, pragmas: tuple[str, ...]) -> None:
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(conn, _record):
+        for pragma in pragmas:
+            conn.execute(pragma)
+
+
+def _add_optimize_listeners(engine) -> None:
+    """Keep planner statistics fresh so the composite/partial indexes get used."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def optimize_on_open(conn, _record):
+        # Recommended for long-lived connections; analyzes only where needed
+        conn.execute("PRAGMA optimize=0x10002")
+
+    @event.listens_for(engine, "close")
+    def optimize_on_close(conn, _record):
+        conn.execute("PRAGMA optimize")
+
+
+def _migrate_timestamps(conn) -> None:
+    """Convert ISO-8601 text timestamps from older databases to epoch milliseconds."""
+    from sqlalchemy import text
+    from redteamai.data.models import Base, EpochMs
+
+    for table in Base.metadata.sorted_tables:
+        for col in table.columns:
+            if isinstance(col.type, EpochMs):
+                conn.execute(text(
+                    f"UPDATE {table.name} SET {col.name} = "
+                    f"CAST(ROUND((julianday({col.name}) - 2440587.5) * 86400000) AS INTEGER) "
+                    f"WHERE typeof({col.name}) = 'text'"
+                ))
+
+
+def _backfill_csv_links(conn) -> None:
+    """Fill finding_cves/host_tags from the CSV columns of rows written before they existed."""
+    from sqlalchemy import insert, select
+    from redteamai.data.models import Finding, FindingCVE, Host, HostTag, split_csv
+
+    links = (
+        (Finding.id, Finding.cve_ids, FindingCVE, "finding_id", "cve_id"),
+        (Host.id, Host.tags, HostTag, "host_id", "tag"),
+    )
+    for owner_id, csv_col, link, fk, value_key in links:
+        # Databases created after the link tables were added are already filled
+        if conn.execute(select(link.id).limit(1)).first() is not None:
+            continue
+        rows = [
+            {fk: row_id, value_key: item}
+            for row_id, csv in conn.execute(select(owner_id, csv_col).where(csv_col.is_not(None)))
+            for item in split_csv(csv)
+        ]
+        if rows:
+            conn.execute(insert(link), rows)
+
+
+# One-off data migrations as (PRAGMA user_version after it, function).
+# Append new steps with the next version; never renumber existing ones.
+_MIGRATIONS = (
+    (1, _migrate_timestamps),
+    (2, _backfill_csv_links),
+)
+
+
+def _run_migrations(engine) -> None:
+    """Apply the migrations newer than the database's user_version, each once."""
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        version = conn.execute(text("PRAGMA user_version")).scalar()
+    for target, migrate in _MIGRATIONS:
+        if version >= target:
+            continue
+        # The version bump commits together with the migration it records
+        with engine.begin() as conn:
+            migrate(conn)
+            conn.execute(text(f"PRAGMA user_version = {target}"))
 
 
 def init_db(db_path: Path | None = None) -> None:
-    """Initialize the SQLite database engine and create tables."""
-    global _engine, _SessionLocal
+    """Initialize the SQLite database engines and create tables."""
+    global _engine, _read_engine, _SessionLocal, _ReadSessionLocal
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.pool import QueuePool
+    from redteamai.data.models import Base
+
     if db_path is None:
         from redteamai.constants import DB_FILE
         db_path = DB_FILE
     db_path.parent.mkdir(parents=True, exist_ok=True)
     url = f"sqlite:///{db_path}"
-    _engine = create_engine(url, connect_args={"check_same_thread": False}, echo=False)
-
-    # Enable WAL for better concurrency
-    @event.listens_for(_engine, "connect")
-    def set_sqlite_pragma(conn, _record):
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
+    # Larger sqlite3 prepared-statement cache (default 128) and SQLAlchemy
+    # compiled-SQL cache (default 500), so repository queries stay compiled
+    connect_args = {"check_same_thread": False, "cached_statements": 256}
+    # Every thread that holds a write session keeps a connection checked out,
+    # so the writer pool must not be the bottleneck: SQLite serializes the
+    # actual writes through busy_timeout. Readers use separate WAL
+    # connections that never wait on a writer.
+    _engine = create_engine(
+        url,
+        connect_args=connect_args,
+        query_cache_size=1200,
+        json_serializer=fastjson.dumps,
+        json_deserializer=fastjson.loads,
+        poolclass=QueuePool,
+        pool_size=2,
+        max_overflow=8,
+        echo=False,
+    )
+    _read_engine = create_engine(
+        url,
+        connect_args=connect_args,
+        query_cache_size=1200,
+        json_serializer=fastjson.dumps,
+        json_deserializer=fastjson.loads,
+        poolclass=QueuePool,
+        pool_size=8,
+        max_overflow=8,
+        echo=False,
+    )
+    # WAL for concurrency, plus cache/fsync tuning for bursty writes
+    _add_pragma_listener(_engine, _SQLITE_PRAGMAS)
+    _add_pragma_listener(_read_engine, (*_SQLITE_PRAGMAS, "PRAGMA query_only=1"))
+    _add_optimize_listeners(_engine)
 
     Base.metadata.create_all(_engine)
-    _SessionLocal = sessionmaker(bind=_engine, autoflush=False, autocommit=False)
+    # create_all skips tables that already exist, so add new indexes to older databases
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(_engine, checkfirst=True)
+    _run_migrations(_engine)
+    # Write sessions expire on commit so objects reload changes made by other
+    # threads. Read sessions never commit; closing them drops their objects.
+    _SessionLocal = scoped_session(sessionmaker(bind=_engine, autoflush=False, autocommit=False))
+    _ReadSessionLocal = scoped_session(sessionmaker(bind=_read_engine, autoflush=False, autocommit=False))
 
 
 def get_session() -> Session:
-    """Return a new SQLAlchemy session. Caller is responsible for closing."""
+    """Return the calling thread's read-write session. Caller is responsible for closing."""
     if _SessionLocal is None:
         init_db()
     return _SessionLocal()
 
 
+get_write_session = get_session
+
+
+def get_read_session() -> Session:
+    """Return the calling thread's read-only session, for list/get queries.
+
+    Caller is responsible for closing, and should do so after each
+    operation: until then the session keeps returning the objects and WAL
+    snapshot it first read. Writes through it fail with
+    "attempt to write a readonly database".
+    """
+    if _ReadSessionLocal is None:
+        init_db()
+    return _ReadSessionLocal()
+
+
+@contextmanager
+def get_db() -> Iterator[Session]:
+    """Yield the thread's session and close it afterwards."""
+    db = get_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def get_engine():
     if _engine is None:
         init_db()
     return _engine
+
+
+def close_db() -> None:
+    """Dispose of both engines, closing (and optimizing) their pooled connections."""
+    global _engine, _read_engine, _SessionLocal, _ReadSessionLocal
+    for scoped in (_SessionLocal, _ReadSessionLocal):
+        if scoped is not None:
+            scoped.remove()
+    for engine in (_read_engine, _engine):
+        if engine is not None:
+            engine.dispose()
+    _engine = _read_engine = _SessionLocal = _ReadSessionLocal = None
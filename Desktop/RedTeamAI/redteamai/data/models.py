@@ -1,26 +1,68 @@
 """SQLAlchemy ORM models for RedTeam AI."""
 from __future__ import annotations
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from sqlalchemy import (
-    String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON
+    String, Text, Integer, BigInteger, Float, Boolean, ForeignKey, JSON, Index, cast, func, text
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
+from sqlalchemy.types import TypeDecorator
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Current UTC time in epoch milliseconds, evaluated by SQLite inside the
+# INSERT/UPDATE. Millisecond resolution keeps rows written in the same
+# second (e.g. messages) in order.
+_NOW = cast(func.round((func.julianday("now") - 2440587.5) * 86400000), BigInteger)
+
+
+class EpochMs(TypeDecorator):
+    """Naive UTC datetime stored as INTEGER epoch milliseconds.
+
+    Integer keys compare and sort faster than ISO-8601 text. Legacy text
+    values are still read; init_db converts them in place.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // timedelta(milliseconds=1)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return _EPOCH + timedelta(milliseconds=value)
+
+
+def split_csv(value: str | None) -> list[str]:
+    """Split a comma-separated column into unique, stripped, non-empty items."""
+    if not value:
+        return []
+    return list(dict.fromkeys(item for item in (v.strip() for v in value.split(",")) if item))
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch SQL-computed timestamps with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class Project(Base):
     __tablename__ = "projects"
+    # Partial index over live projects only; soft-deleted rows drop out of it
+    __table_args__ = (Index("ix_projects_live", "updated_at", sqlite_where=text("is_active = 1")),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     scope: Mapped[Optional[str]] = mapped_column(Text)  # Comma-sep targets
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW)
+    updated_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW, onupdate=_NOW)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     hosts: Mapped[list[Host]] = relationship("Host", back_populates="project", cascade="all, delete-orphan")
@@ -31,6 +73,7 @@ class Project(Base):
 
 class Host(Base):
     __tablename__ = "hosts"
+    __table_args__ = (Index("ix_hosts_project", "project_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
@@ -39,17 +82,33 @@ class Host(Base):
     os_info: Mapped[Optional[str]] = mapped_column(String(500))
     status: Mapped[str] = mapped_column(String(20), default="unknown")  # up/down/unknown
     open_ports: Mapped[Optional[dict]] = mapped_column(JSON)  # {port: {service, version, protocol}}
-    tags: Mapped[Optional[str]] = mapped_column(Text)
+    tags: Mapped[Optional[str]] = mapped_column(Text)  # Comma-sep, mirrored in host_tags
     notes: Mapped[Optional[str]] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW)
+    updated_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW, onupdate=_NOW)
 
     project: Mapped[Project] = relationship("Project", back_populates="hosts")
     findings: Mapped[list[Finding]] = relationship("Finding", back_populates="host")
+    tag_rows: Mapped[list[HostTag]] = relationship(cascade="all, delete-orphan")
+
+    @validates("tags")
+    def _sync_tags(self, _key, value):
+        # Mirror the CSV into host_tags so tag filters can use an index
+        self.tag_rows = [HostTag(tag=t) for t in split_csv(value)]
+        return value
+
+
+class HostTag(Base):
+    __tablename__ = "host_tags"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    host_id: Mapped[int] = mapped_column(ForeignKey("hosts.id", ondelete="CASCADE"), index=True, nullable=False)
+    tag: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
 
 
 class Finding(Base):
     __tablename__ = "findings"
+    __table_args__ = (Index("ix_findings_project_created", "project_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
@@ -58,26 +117,42 @@ class Finding(Base):
     description: Mapped[Optional[str]] = mapped_column(Text)
     severity: Mapped[str] = mapped_column(String(20), default="info")  # critical/high/medium/low/info
     cvss_score: Mapped[Optional[float]] = mapped_column(Float)
-    cve_ids: Mapped[Optional[str]] = mapped_column(Text)  # Comma-sep CVE IDs
+    cve_ids: Mapped[Optional[str]] = mapped_column(Text)  # Comma-sep CVE IDs, mirrored in finding_cves
     remediation: Mapped[Optional[str]] = mapped_column(Text)
     evidence: Mapped[Optional[str]] = mapped_column(Text)
     status: Mapped[str] = mapped_column(String(20), default="open")  # open/confirmed/false_positive/fixed
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW)
+    updated_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW, onupdate=_NOW)
 
     project: Mapped[Project] = relationship("Project", back_populates="findings")
     host: Mapped[Optional[Host]] = relationship("Host", back_populates="findings")
+    cves: Mapped[list[FindingCVE]] = relationship(cascade="all, delete-orphan")
+
+    @validates("cve_ids")
+    def _sync_cves(self, _key, value):
+        # Mirror the CSV into finding_cves so CVE lookups can use an index
+        self.cves = [FindingCVE(cve_id=c) for c in split_csv(value)]
+        return value
+
+
+class FindingCVE(Base):
+    __tablename__ = "finding_cves"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    finding_id: Mapped[int] = mapped_column(ForeignKey("findings.id", ondelete="CASCADE"), index=True, nullable=False)
+    cve_id: Mapped[str] = mapped_column(String(32), index=True, nullable=False)
 
 
 class Session(Base):
     __tablename__ = "sessions"
+    __table_args__ = (Index("ix_sessions_project_updated", "project_id", "updated_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(200), default="New Session")
     module: Mapped[str] = mapped_column(String(50), default="chat")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW)
+    updated_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW, onupdate=_NOW)
 
     project: Mapped[Project] = relationship("Project", back_populates="sessions")
     messages: Mapped[list[Message]] = relationship("Message", back_populates="session", cascade="all, delete-orphan")
@@ -85,6 +160,7 @@ class Session(Base):
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (Index("ix_messages_session_created", "session_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), nullable=False)
@@ -93,13 +169,14 @@ class Message(Base):
     tool_name: Mapped[Optional[str]] = mapped_column(String(100))
     tool_call_id: Mapped[Optional[str]] = mapped_column(String(100))
     metadata_: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW)
 
     session: Mapped[Session] = relationship("Session", back_populates="messages")
 
 
 class ToolRun(Base):
     __tablename__ = "tool_runs"
+    __table_args__ = (Index("ix_tool_runs_project_created", "project_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
@@ -109,6 +186,6 @@ class ToolRun(Base):
     exit_code: Mapped[Optional[int]] = mapped_column(Integer)
     duration_ms: Mapped[Optional[int]] = mapped_column(Integer)
     status: Mapped[str] = mapped_column(String(20), default="pending")  # pending/running/completed/failed
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(EpochMs, default=_NOW)
 
     project: Mapped[Project] = relationship("Project", back_populates="tool_runs")
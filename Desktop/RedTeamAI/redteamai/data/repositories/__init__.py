@@ -1 +1,5 @@
 # Repository layer for CRUD operations
+#
+# List queries are built with lambda_stmt(), so the statement and its cache
+# key are constructed once; closure variables such as project_id become
+# bound parameters on each call.
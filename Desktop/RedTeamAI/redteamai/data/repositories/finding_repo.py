@@ -1,8 +1,9 @@
 """CRUD operations for Findings."""
 from __future__ import annotations
-from typing import Optional
+from typing import Iterator, Optional
+from sqlalchemy import Row, lambda_stmt, select
 from sqlalchemy.orm import Session
-from redteamai.data.models import Finding
+from redteamai.data.models import Finding, FindingCVE
 
 
 def create_finding(db: Session, project_id: int, title: str, severity: str = "info", **kwargs) -> Finding:
@@ -13,12 +14,53 @@ def create_finding(db: Session, project_id: int, title: str, severity: str = "in
     return finding
 
 
+def bulk_create_findings(db: Session, project_id: int, items: list[dict]) -> list[Finding]:
+    """Insert many findings with a single commit. Each item holds Finding column values."""
+    findings = [Finding(project_id=project_id, **item) for item in items]
+    db.add_all(findings)
+    db.commit()
+    return findings
+
+
 def get_finding(db: Session, finding_id: int) -> Optional[Finding]:
     return db.get(Finding, finding_id)
 
 
 def list_findings(db: Session, project_id: int) -> list[Finding]:
-    return db.query(Finding).filter(Finding.project_id == project_id).order_by(Finding.created_at.desc()).all()
+    return list(iter_findings(db, project_id))
+
+
+def iter_findings(db: Session, project_id: int, batch_size: int = 200) -> Iterator[Finding]:
+    """Stream a project's findings, newest first, in batches.
+
+    The query holds its connection until the iterator is exhausted, so use
+    a read session for long iterations.
+    """
+    stmt = lambda_stmt(
+        lambda: select(Finding).where(Finding.project_id == project_id).order_by(Finding.created_at.desc())
+    )
+    return iter(db.execute(stmt, execution_options={"yield_per": batch_size}).scalars())
+
+
+def list_findings_by_cve(db: Session, cve_id: str) -> list[Finding]:
+    """Findings referencing a CVE, found through the indexed finding_cves table."""
+    stmt = lambda_stmt(
+        lambda: select(Finding)
+        .join(FindingCVE, FindingCVE.finding_id == Finding.id)
+        .where(FindingCVE.cve_id == cve_id)
+        .order_by(Finding.created_at.desc())
+    )
+    return list(db.execute(stmt).scalars().unique())
+
+
+def list_findings_summary(db: Session, project_id: int) -> list[Row]:
+    """(id, title, severity, status, created_at) rows for list views, newest first."""
+    stmt = lambda_stmt(
+        lambda: select(Finding.id, Finding.title, Finding.severity, Finding.status, Finding.created_at)
+        .where(Finding.project_id == project_id)
+        .order_by(Finding.created_at.desc())
+    )
+    return list(db.execute(stmt))
 
 
 def update_finding(db: Session, finding_id: int, **kwargs) -> Optional[Finding]:
@@ -1,6 +1,7 @@
 """CRUD operations for Projects."""
 from __future__ import annotations
 from typing import Optional
+from sqlalchemy import Row, lambda_stmt, select, true, update
 from sqlalchemy.orm import Session
 from redteamai.data.models import Project
 
@@ -18,7 +19,21 @@ def get_project(db: Session, project_id: int) -> Optional[Project]:
 
 
 def list_projects(db: Session) -> list[Project]:
-    return db.query(Project).filter(Project.is_active == True).order_by(Project.updated_at.desc()).all()
+    # true() renders a literal 1, which SQLite needs to match the partial index
+    stmt = lambda_stmt(
+        lambda: select(Project).where(Project.is_active == true()).order_by(Project.updated_at.desc())
+    )
+    return list(db.execute(stmt).scalars())
+
+
+def list_projects_summary(db: Session) -> list[Row]:
+    """(id, name, updated_at) rows of live projects for list views."""
+    stmt = lambda_stmt(
+        lambda: select(Project.id, Project.name, Project.updated_at)
+        .where(Project.is_active == true())
+        .order_by(Project.updated_at.desc())
+    )
+    return list(db.execute(stmt))
 
 
 def update_project(db: Session, project_id: int, **kwargs) -> Optional[Project]:
@@ -32,9 +47,7 @@ def update_project(db: Session, project_id: int, **kwargs) -> Optional[Project]:
 
 
 def delete_project(db: Session, project_id: int) -> bool:
-    project = db.get(Project, project_id)
-    if project:
-        project.is_active = False
-        db.commit()
-        return True
-    return False
+    """Soft-delete a project with a single UPDATE, without loading the row."""
+    result = db.execute(update(Project).where(Project.id == project_id).values(is_active=False))
+    db.commit()
+    return result.rowcount > 0
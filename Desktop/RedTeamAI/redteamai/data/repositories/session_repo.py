@@ -1,6 +1,7 @@
 """CRUD operations for Sessions and Messages."""
 from __future__ import annotations
-from typing import Optional
+from typing import Iterator, Optional
+from sqlalchemy import Row, lambda_stmt, select
 from sqlalchemy.orm import Session as DBSession
 from redteamai.data.models import Session, Message
 
@@ -18,7 +19,10 @@ def get_session_by_id(db: DBSession, session_id: int) -> Optional[Session]:
 
 
 def list_sessions(db: DBSession, project_id: int) -> list[Session]:
-    return db.query(Session).filter(Session.project_id == project_id).order_by(Session.updated_at.desc()).all()
+    stmt = lambda_stmt(
+        lambda: select(Session).where(Session.project_id == project_id).order_by(Session.updated_at.desc())
+    )
+    return list(db.execute(stmt).scalars())
 
 
 def add_message(db: DBSession, session_id: int, role: str, content: str, **kwargs) -> Message:
@@ -29,5 +33,35 @@ def add_message(db: DBSession, session_id: int, role: str, content: str, **kwarg
     return msg
 
 
+def bulk_add_messages(db: DBSession, session_id: int, items: list[dict]) -> list[Message]:
+    """Insert many messages with a single commit. Each item holds Message column values."""
+    msgs = [Message(session_id=session_id, **item) for item in items]
+    db.add_all(msgs)
+    db.commit()
+    return msgs
+
+
 def get_messages(db: DBSession, session_id: int) -> list[Message]:
-    return db.query(Message).filter(Message.session_id == session_id).order_by(Message.created_at).all()
+    return list(iter_messages(db, session_id))
+
+
+def iter_messages(db: DBSession, session_id: int, batch_size: int = 200) -> Iterator[Message]:
+    """Stream a session's messages in batches instead of loading them all.
+
+    The query holds its connection until the iterator is exhausted, so use
+    a read session for long iterations.
+    """
+    stmt = lambda_stmt(
+        lambda: select(Message).where(Message.session_id == session_id).order_by(Message.created_at)
+    )
+    return iter(db.execute(stmt, execution_options={"yield_per": batch_size}).scalars())
+
+
+def list_messages_summary(db: DBSession, session_id: int) -> list[Row]:
+    """(id, role, tool_name, created_at) rows without the potentially large content."""
+    stmt = lambda_stmt(
+        lambda: select(Message.id, Message.role, Message.tool_name, Message.created_at)
+        .where(Message.session_id == session_id)
+        .order_by(Message.created_at)
+    )
+    return list(db.execute(stmt))
@@ -0,0 +1,37 @@
+"""CRUD operations for ToolRuns."""
+from __future__ import annotations
+from typing import Optional
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.orm import Session
+from redteamai.data.models import ToolRun
+
+
+def create_tool_run(db: Session, project_id: int, tool_name: str, command: str, **kwargs) -> ToolRun:
+    run = ToolRun(project_id=project_id, tool_name=tool_name, command=command, **kwargs)
+    db.add(run)
+    db.commit()
+    db.refresh(run)
+    return run
+
+
+def get_tool_run(db: Session, tool_run_id: int) -> Optional[ToolRun]:
+    return db.get(ToolRun, tool_run_id)
+
+
+def list_tool_runs(db: Session, project_id: int) -> list[ToolRun]:
+    stmt = lambda_stmt(
+        lambda: select(ToolRun).where(ToolRun.project_id == project_id).order_by(ToolRun.created_at.desc())
+    )
+    return list(db.execute(stmt).scalars())
+
+
+def read_output_preview(db: Session, tool_run_id: int, nchars: int = 4096) -> Optional[str]:
+    """Return the start of a tool run's output without loading all of it.
+
+    substr() runs in SQLite, so only the first `nchars` characters are
+    returned to Python.
+    """
+    stmt = lambda_stmt(
+        lambda: select(func.substr(ToolRun.output, 1, nchars)).where(ToolRun.id == tool_run_id)
+    )
+    return db.scalar(stmt)
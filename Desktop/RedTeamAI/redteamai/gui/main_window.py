@@ -1,12 +1,12 @@
 """Main application window: nav rail + module stack + AI chat panel."""
 from __future__ import annotations
-import asyncio
+from concurrent.futures import Future, wait as wait_futures
 from typing import Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
     QStackedWidget, QMessageBox, QApplication
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSlot
+from PyQt6.QtCore import Qt, QObject, QRunnable, QSize, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QKeySequence, QShortcut
 
 from redteamai.app import AppState
@@ -24,15 +24,81 @@ from redteamai.gui.modules.reporting_module import ReportingModule
 from redteamai.gui.modules.settings_module import SettingsModule
 from redteamai.tools.registry import build_default_registry, ToolRegistry
 from redteamai.workers.tool_worker import ToolWorker
-from redteamai.workers.ai_worker import AIWorker
+from redteamai.workers.ai_worker import AILoopThread, AIWorker
+from redteamai.workers.health_worker import HealthCheckWorker
 from redteamai.ai.backend_factory import create_backend
 from redteamai.ai.agent import RedTeamAgent
 from redteamai.ai.message_history import MessageHistory
 from redteamai.ai.prompt_templates import get_prompt
+from redteamai.data import close_db
 from redteamai.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+_TOOL_FLUSH_MS = 80
+_AI_FLUSH_MS = 60
+_STATUS_DEBOUNCE_MS = 100
+# Cap on tools run through execute() at once (each holds a pool thread)
+_MAX_TOOL_JOBS = 5
+
+# Stack order of the modules; nav rail names map to these indices
+MODULE_ORDER = ("dashboard", "targets", "recon", "web_scan", "exploitation", "ctf", "reporting", "settings")
+_MODULE_INDEX = {name: idx for idx, name in enumerate(MODULE_ORDER)}
+
+
+class _ReportJobSignals(QObject):
+    done = pyqtSignal(str)    # output path
+    failed = pyqtSignal(str)  # error message
+
+
+class _ReportJob(QRunnable):
+    """Writes a report on a pool thread so large HTML/PDF exports don't freeze the UI."""
+
+    def __init__(self, findings: list[dict], fmt: str, path: str):
+        super().__init__()
+        self.findings = findings
+        self.fmt = fmt
+        self.path = path
+        self.signals = _ReportJobSignals()
+
+    def run(self) -> None:
+        from redteamai.reporting.generator import generate_report
+        try:
+            generate_report(self.findings, self.fmt, self.path)
+        except Exception as e:
+            log.exception("Report generation failed")
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.done.emit(self.path)
+
+
+def _persist_settings(settings) -> None:
+    """Write config.toml from a pool thread; failures are logged, not raised into Qt."""
+    from redteamai.config.manager import save_config
+    try:
+        save_config(settings)
+    except Exception:
+        log.exception("Saving settings failed")
+
+
+class _ToolJobSignals(QObject):
+    done = pyqtSignal(str, str)  # (tool_name, output)
+
+
+class _ToolJob(QRunnable):
+    """Runs a tool's blocking execute() on a pool thread (built-ins and tools without get_command)."""
+
+    def __init__(self, registry: ToolRegistry, tool_name: str, kwargs: dict):
+        super().__init__()
+        self.registry = registry
+        self.tool_name = tool_name
+        self.kwargs = kwargs
+        self.signals = _ToolJobSignals()
+
+    def run(self) -> None:
+        result = self.registry.execute(self.tool_name, **self.kwargs)
+        self.signals.done.emit(self.tool_name, result.output or result.error)
+
 
 class MainWindow(QMainWindow):
     def __init__(self, app_state: AppState):
@@ -40,8 +106,40 @@ class MainWindow(QMainWindow):
         self.app_state = app_state
         self._tool_worker: Optional[ToolWorker] = None
         self._ai_worker: Optional[AIWorker] = None
+        self._tool_pool = QThreadPool(self)
+        self._tool_pool.setMaxThreadCount(_MAX_TOOL_JOBS)
+        # Single thread, so config writes land on disk in save order
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        self._health_pending: set[str] = set()
+        # Started on the first check and reused for later ones
+        self._health_worker = HealthCheckWorker(self)
+        self._health_worker.signals.done.connect(self._on_health_checked, Qt.ConnectionType.QueuedConnection)
+        # One agent (backend + history) per module, kept across messages. All
+        # turns run on one loop, so backends keep their HTTP connections.
+        self._agents: dict[str, RedTeamAgent] = {}
+        self._ai_loop = AILoopThread(self)
+        self._ai_module = ""
         self._current_tool_bubble = None
-        self._tool_output_buffer = ""
+        # Tool stdout is collected here and flushed to the terminal of the
+        # module that started the tool once per _TOOL_FLUSH_MS, instead of
+        # one append per line
+        self._pending_lines: list[str] = []
+        self._tool_module = ""
+        self._tool_flush_timer = QTimer(self)
+        self._tool_flush_timer.setInterval(_TOOL_FLUSH_MS)
+        self._tool_flush_timer.timeout.connect(self._flush_tool_lines)
+        # Streamed AI text is coalesced the same way, at _AI_FLUSH_MS
+        self._ai_chunk_buffer: list[str] = []
+        self._ai_flush_timer = QTimer(self)
+        self._ai_flush_timer.setInterval(_AI_FLUSH_MS)
+        self._ai_flush_timer.timeout.connect(self._flush_ai_chunks)
+        # Status messages within _STATUS_DEBOUNCE_MS collapse into one update; last one wins
+        self._status_pending: str | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(_STATUS_DEBOUNCE_MS)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._commit_status)
 
         self._setup_registry()
         self._setup_ui()
@@ -51,7 +149,12 @@ class MainWindow(QMainWindow):
 
     def _setup_registry(self) -> None:
         self._registry = build_default_registry(self.app_state.settings)
-        log.info(f"Tool registry loaded: {len(self._registry.list_tools())} tools")
+        # Availability only changes when the registry is rebuilt, so these are
+        # computed here once instead of on every AI request or stats refresh
+        self._cached_tool_list = self._registry.list_tools()
+        self._cached_manifest = self._registry.get_manifest()
+        self._cached_available = sum(1 for t in self._cached_tool_list if t["available"])
+        log.info(f"Tool registry loaded: {len(self._cached_tool_list)} tools")
 
     def _setup_ui(self) -> None:
         self.setWindowTitle("RedTeam AI")
@@ -72,20 +175,22 @@ class MainWindow(QMainWindow):
         # ── Module Stack + AI Panel ────────────────────────────────────────
         splitter = QSplitter(Qt.Orientation.Horizontal)
 
-        # Module stacks
+        # Module stack: cheap placeholders, each replaced by the real module
+        # the first time it is used (see _module)
         self._stack = QStackedWidget()
-        self._dashboard   = DashboardModule()
-        self._targets     = TargetManagerModule()
-        self._recon       = ReconModule()
-        self._web_scan    = WebScanModule()
-        self._exploitation = ExploitationModule()
-        self._ctf         = CTFModule()
-        self._reporting   = ReportingModule()
-        self._settings    = SettingsModule(self.app_state.settings)
-
-        for module in [self._dashboard, self._targets, self._recon, self._web_scan,
-                       self._exploitation, self._ctf, self._reporting, self._settings]:
-            self._stack.addWidget(module)
+        self._module_factories = {
+            "dashboard":    DashboardModule,
+            "targets":      TargetManagerModule,
+            "recon":        ReconModule,
+            "web_scan":     WebScanModule,
+            "exploitation": ExploitationModule,
+            "ctf":          CTFModule,
+            "reporting":    ReportingModule,
+            "settings":     lambda: SettingsModule(self.app_state.settings),
+        }
+        self._modules: dict[str, QWidget] = {}
+        for _ in MODULE_ORDER:
+            self._stack.addWidget(QWidget())
 
         # AI Chat Panel
         self._ai_panel = AIChatPanel()
@@ -102,8 +207,9 @@ class MainWindow(QMainWindow):
         self._status_bar = AppStatusBar()
         self.setStatusBar(self._status_bar)
 
-        # Update dashboard stats
+        # Only the start page is built up front
         self._update_dashboard_stats()
+        self._stack.setCurrentWidget(self._dashboard)
 
     def _setup_shortcuts(self) -> None:
         # Ctrl+K command palette (stub)
@@ -114,58 +220,69 @@ class MainWindow(QMainWindow):
         # Nav rail
         self._nav_rail.module_changed.connect(self._navigate)
 
-        # Dashboard
-        self._dashboard.module_navigate.connect(self._navigate)
-
-        # Targets
-        self._targets.scan_requested.connect(self._handle_scan_from_target)
-
-        # Recon module
-        self._recon.run_tool.connect(self._run_tool)
-        self._recon.ask_ai.connect(self._send_to_ai)
-        self._recon.save_to_project.connect(self._save_output_to_project)
-
-        # Web scan
-        self._web_scan.run_tool.connect(self._run_tool)
-        self._web_scan.ask_ai.connect(self._send_to_ai)
-        self._web_scan.save_to_project.connect(self._save_output_to_project)
-
-        # Exploitation
-        self._exploitation.run_tool.connect(self._run_tool)
-        self._exploitation.ask_ai.connect(self._send_to_ai)
-
-        # CTF
-        self._ctf.ask_ai.connect(self._send_to_ai)
-
-        # Reporting
-        self._reporting.ask_ai.connect(self._send_to_ai)
-        self._reporting.generate_report.connect(self._generate_report)
-
-        # Settings
-        self._settings.settings_changed.connect(self._on_settings_changed)
-        self._settings.health_check_requested.connect(self._health_check)
+        # Modules are wired in _wire_module as they are created
 
         # AI Panel
         self._ai_panel.send_requested.connect(self._send_to_ai)
         self._ai_panel.connect_stop(self._stop_ai)
+        self._ai_panel.clear_requested.connect(self._reset_agents)
+
+    def _wire_module(self, name: str, widget: QWidget) -> None:
+        if name == "dashboard":
+            widget.module_navigate.connect(self._navigate)
+        elif name == "targets":
+            widget.scan_requested.connect(self._handle_scan_from_target)
+        elif name in ("recon", "web_scan"):
+            widget.run_tool.connect(self._run_tool)
+            widget.ask_ai.connect(self._send_to_ai)
+            widget.save_to_project.connect(self._save_output_to_project)
+        elif name == "exploitation":
+            widget.run_tool.connect(self._run_tool)
+            widget.ask_ai.connect(self._send_to_ai)
+        elif name == "ctf":
+            widget.ask_ai.connect(self._send_to_ai)
+        elif name == "reporting":
+            widget.ask_ai.connect(self._send_to_ai)
+            widget.generate_report.connect(self._generate_report)
+        elif name == "settings":
+            widget.settings_changed.connect(self._on_settings_changed)
+            widget.health_check_requested.connect(self._health_check)
+
+    def _module(self, name: str) -> QWidget:
+        """Return a module widget, building it in place of its placeholder on first use."""
+        widget = self._modules.get(name)
+        if widget is None:
+            widget = self._modules[name] = self._module_factories[name]()
+            idx = _MODULE_INDEX[name]
+            placeholder = self._stack.widget(idx)
+            self._stack.removeWidget(placeholder)
+            self._stack.insertWidget(idx, widget)
+            placeholder.deleteLater()
+            self._wire_module(name, widget)
+        return widget
+
+    _dashboard    = property(lambda self: self._module("dashboard"))
+    _targets      = property(lambda self: self._module("targets"))
+    _recon        = property(lambda self: self._module("recon"))
+    _web_scan     = property(lambda self: self._module("web_scan"))
+    _exploitation = property(lambda self: self._module("exploitation"))
+    _ctf          = property(lambda self: self._module("ctf"))
+    _reporting    = property(lambda self: self._module("reporting"))
+    _settings     = property(lambda self: self._module("settings"))
 
     # ── Navigation ────────────────────────────────────────────────────────
 
     @pyqtSlot(str)
     def _navigate(self, module: str) -> None:
-        module_map = {
-            "dashboard":    0,
-            "targets":      1,
-            "recon":        2,
-            "web_scan":     3,
-            "exploitation": 4,
-            "ctf":          5,
-            "reporting":    6,
-            "settings":     7,
-        }
-        idx = module_map.get(module, 0)
-        self._stack.setCurrentIndex(idx)
-        self._nav_rail.set_active(module)
+        if module not in _MODULE_INDEX:
+            module = "dashboard"
+        # Coalesce the stack switch and nav rail update into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._stack.setCurrentWidget(self._module(module))
+            self._nav_rail.set_active(module)
+        finally:
+            self.setUpdatesEnabled(True)
         self.app_state.active_module = module
 
     # ── Tool Execution ────────────────────────────────────────────────────
@@ -174,28 +291,26 @@ class MainWindow(QMainWindow):
     def _run_tool(self, tool_name: str, kwargs: dict) -> None:
         tool = self._registry.get_tool(tool_name)
         if not tool:
-            self._status_bar.set_status(f"Tool '{tool_name}' not found")
+            self._queue_status(f"Tool '{tool_name}' not found")
             return
 
         if not self._registry.is_available(tool_name):
             hint = self._registry.get_hint(tool_name)
             msg = f"[{tool.display_name}] Not installed or not found in PATH.\n{hint}"
             self._show_tool_output(tool_name, msg)
-            self._status_bar.set_status(f"{tool.display_name} not available")
+            self._queue_status(f"{tool.display_name} not available")
             return
 
-        # For built-in tools (CTF), run inline
+        # Built-in tools (CTF, CVE lookup) may do network I/O: run them on the pool
         if tool.is_builtin:
-            result = self._registry.execute(tool_name, **kwargs)
-            self._show_tool_output(tool_name, result.output or result.error)
+            self._start_tool_job(tool_name, kwargs)
             return
 
         # Build command for subprocess
         cmd = tool.get_command(**kwargs)
         if not cmd:
-            # Fallback: run via executor
-            result = self._registry.execute(tool_name, **kwargs)
-            self._show_tool_output(tool_name, result.output or result.error)
+            # Fallback: the executor blocks until the tool exits, so keep it off the GUI thread
+            self._start_tool_job(tool_name, kwargs)
             return
 
         # Confirm for dangerous tools
@@ -206,22 +321,35 @@ class MainWindow(QMainWindow):
 
         self._start_tool_worker(tool_name, cmd)
 
+    def _start_tool_job(self, tool_name: str, kwargs: dict) -> None:
+        job = _ToolJob(self._registry, tool_name, kwargs)
+        job.signals.done.connect(self._on_tool_job_done, Qt.ConnectionType.QueuedConnection)
+        self._queue_status(f"Running {tool_name}…")
+        self._tool_pool.start(job)
+
+    def _on_tool_job_done(self, tool_name: str, output: str) -> None:
+        # Jobs can finish in any order, so label each block of output
+        self._show_tool_output(tool_name, f"[{tool_name}]\n{output}\n")
+        self._queue_status(f"{tool_name} finished")
+
     def _start_tool_worker(self, tool_name: str, cmd: list[str]) -> None:
         if self._tool_worker and self._tool_worker.isRunning():
             self._tool_worker.stop()
 
-        self._tool_output_buffer = ""
+        self._flush_tool_lines()
+        # Output keeps going to this module if the user navigates away
+        self._tool_module = self.app_state.active_module
         self._tool_worker = ToolWorker(cmd)
-        self._tool_worker.signals.output_line.connect(self._on_tool_line)
+        self._tool_worker.signals.output_lines.connect(self._on_tool_lines)
         self._tool_worker.signals.finished.connect(lambda code, out: self._on_tool_finished(tool_name, code, out))
         self._tool_worker.signals.error.connect(self._on_tool_error)
         self._tool_worker.start()
+        self._tool_flush_timer.start()
 
         self._status_bar.set_tool_busy(True, tool_name)
         self.app_state.tool_busy = True
 
-        # Show output in active module
-        active = self.app_state.active_module
+        active = self._tool_module
         if active == "recon":
             self._recon.set_tool_busy(True, tool_name)
             self._recon.append_output(f"$ {' '.join(cmd)}\n")
@@ -229,23 +357,32 @@ class MainWindow(QMainWindow):
             self._web_scan.set_tool_busy(True, tool_name)
             self._web_scan.append_output(f"$ {' '.join(cmd)}\n")
 
-    @pyqtSlot(str)
-    def _on_tool_line(self, line: str) -> None:
-        self._tool_output_buffer += line + "\n"
-        active = self.app_state.active_module
+    @pyqtSlot(list)
+    def _on_tool_lines(self, lines: list) -> None:
+        self._pending_lines.extend(lines)
+
+    def _flush_tool_lines(self) -> None:
+        """Append all lines received since the last tick in one terminal update."""
+        if not self._pending_lines:
+            return
+        text = "\n".join(self._pending_lines) + "\n"
+        self._pending_lines.clear()
+        active = self._tool_module
         if active == "recon":
-            self._recon.append_output(line)
+            self._recon.append_output(text)
         elif active == "web_scan":
-            self._web_scan.append_output(line)
+            self._web_scan.append_output(text)
         elif active == "exploitation":
-            self._exploitation.append_output(line)
+            self._exploitation.append_output(text)
 
     @pyqtSlot(str, int, str)
     def _on_tool_finished(self, tool_name: str, exit_code: int, full_output: str) -> None:
+        self._tool_flush_timer.stop()
+        self._flush_tool_lines()
         self._status_bar.set_tool_busy(False)
         self.app_state.tool_busy = False
 
-        active = self.app_state.active_module
+        active = self._tool_module
         if active == "recon":
             self._recon.set_tool_busy(False)
             color = "#3fb950" if exit_code == 0 else "#f85149"
@@ -260,8 +397,10 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(str)
     def _on_tool_error(self, error: str) -> None:
+        self._tool_flush_timer.stop()
+        self._flush_tool_lines()
         self._status_bar.set_tool_busy(False)
-        self._status_bar.set_status(f"Tool error: {error}")
+        self._queue_status(f"Tool error: {error}")
         self.app_state.tool_busy = False
 
     def _show_tool_output(self, tool_name: str, output: str) -> None:
@@ -290,36 +429,82 @@ class MainWindow(QMainWindow):
         self._ai_panel.add_user_message(message)
         self._ai_panel.begin_ai_response()
 
-        # Build agent
-        backend = create_backend(self.app_state.settings)
-        history = MessageHistory(
-            system_prompt=get_prompt(self.app_state.active_module),
-            max_tokens=self.app_state.settings.max_agent_iterations * 800,
-        )
-        agent = RedTeamAgent(
-            backend=backend,
-            tool_executor=self._registry.execute_from_ai,
-            tools_manifest=self._registry.get_manifest(),
-            history=history,
-            max_iterations=self.app_state.settings.max_agent_iterations,
-            require_confirm_dangerous=self.app_state.settings.require_confirm_dangerous,
-        )
-
-        self._ai_worker = AIWorker(agent, message)
-        self._ai_worker.signals.text_chunk.connect(self._on_ai_chunk)
-        self._ai_worker.signals.tool_call.connect(self._on_ai_tool_call)
-        self._ai_worker.signals.tool_result.connect(self._on_ai_tool_result)
-        self._ai_worker.signals.confirm_required.connect(self._on_confirm_required)
-        self._ai_worker.signals.done.connect(self._on_ai_done)
-        self._ai_worker.signals.error.connect(self._on_ai_error)
+        self._ai_module = self.app_state.active_module
+        agent = self._get_agent(self._ai_module)
+        # Chunks a stopped worker had already queued belong to the old reply
+        self._ai_chunk_buffer.clear()
+        self._ai_worker = AIWorker(self._ai_loop, agent, message)
+        # Always emitted from the worker thread: queue explicitly rather than
+        # letting AutoConnection compare threads on every emit
+        queued = Qt.ConnectionType.QueuedConnection
+        self._ai_worker.signals.text_chunk.connect(self._on_ai_chunk, queued)
+        self._ai_worker.signals.tool_call.connect(self._on_ai_tool_call, queued)
+        self._ai_worker.signals.tool_result.connect(self._on_ai_tool_result, queued)
+        self._ai_worker.signals.confirm_required.connect(self._on_confirm_required, queued)
+        self._ai_worker.signals.done.connect(self._on_ai_done, queued)
+        self._ai_worker.signals.error.connect(self._on_ai_error, queued)
         self._ai_worker.start()
+        self._ai_flush_timer.start()
+
+    def _get_agent(self, module: str) -> RedTeamAgent:
+        """Return the module's agent, building backend and history on first use."""
+        agent = self._agents.get(module)
+        if agent is None:
+            backend = create_backend(self.app_state.settings)
+            history = MessageHistory(
+                system_prompt=get_prompt(module),
+                max_tokens=self.app_state.settings.max_agent_iterations * 800,
+            )
+            agent = self._agents[module] = RedTeamAgent(
+                backend=backend,
+                tool_executor=self._registry.execute_from_ai,
+                tools_manifest=self._cached_manifest,
+                history=history,
+                max_iterations=self.app_state.settings.max_agent_iterations,
+                require_confirm_dangerous=self.app_state.settings.require_confirm_dangerous,
+            )
+        return agent
+
+    def _reset_agents(self) -> list[Future]:
+        """Drop cached agents so the next message starts a fresh conversation.
+
+        Returns the futures of the client closes that were started.
+        """
+        return [f for f in map(self._drop_agent, list(self._agents)) if f is not None]
+
+    def _drop_agent(self, module: str) -> Optional[Future]:
+        """Forget a module's agent and close its backend's client on the AI loop."""
+        agent = self._agents.pop(module, None)
+        if agent is None:
+            return None
+
+        def close(_turn=None) -> Future:
+            return self._ai_loop.submit(agent.backend.aclose())
+
+        worker = self._ai_worker
+        if worker is not None and worker.agent is agent and worker.isRunning():
+            # Still answering: close once the turn ends (or is cancelled)
+            worker.future.add_done_callback(close)
+            return None
+        return close()
 
     @pyqtSlot(str)
     def _on_ai_chunk(self, text: str) -> None:
-        self._ai_panel.append_ai_chunk(text)
+        self._ai_chunk_buffer.append(text)
+
+    def _flush_ai_chunks(self) -> None:
+        if self._ai_chunk_buffer:
+            self._ai_panel.append_ai_chunk("".join(self._ai_chunk_buffer))
+            self._ai_chunk_buffer.clear()
+
+    def _end_ai_stream(self) -> None:
+        self._ai_flush_timer.stop()
+        self._flush_ai_chunks()
 
     @pyqtSlot(str, dict)
     def _on_ai_tool_call(self, tool_name: str, args: dict) -> None:
+        # Text streamed before the call must land above its bubble
+        self._flush_ai_chunks()
         self._current_tool_bubble = self._ai_panel.add_tool_call(tool_name, args)
 
     @pyqtSlot(str, str, bool)
@@ -336,23 +521,38 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(str, int)
     def _on_ai_done(self, final: str, iterations: int) -> None:
+        self._end_ai_stream()
         self._ai_panel.finalize_ai_response(final)
         self._ai_panel.set_busy(False)
         self._status_bar.set_ai_busy(False)
-        self._status_bar.set_status(f"AI done ({iterations} iteration{'s' if iterations != 1 else ''})")
+        self._queue_status(f"AI done ({iterations} iteration{'s' if iterations != 1 else ''})")
         self.app_state.ai_busy = False
 
     @pyqtSlot(str)
     def _on_ai_error(self, error: str) -> None:
+        self._end_ai_stream()
+        # The failed turn may have left unanswered tool calls in the history
+        self._drop_agent(self._ai_module)
         self._ai_panel.finalize_ai_response(f"**Error:** {error}")
         self._ai_panel.set_busy(False)
         self._status_bar.set_ai_busy(False)
-        self._status_bar.set_status(f"AI error: {error[:60]}")
+        self._queue_status(f"AI error: {error[:60]}")
         self.app_state.ai_busy = False
 
     def _stop_ai(self) -> None:
         if self._ai_worker:
+            signals = self._ai_worker.signals
+            # Late output from the cancelled turn must not reach the next reply
+            for signal in (signals.text_chunk, signals.tool_call, signals.tool_result,
+                           signals.confirm_required, signals.done, signals.error):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass  # Already disconnected by an earlier stop
             self._ai_worker.stop()
+        self._end_ai_stream()
+        # A cancelled turn may have left unanswered tool calls in the history
+        self._drop_agent(self._ai_module)
         self._ai_panel.set_busy(False)
         self._status_bar.set_ai_busy(False)
         self.app_state.ai_busy = False
@@ -367,56 +567,74 @@ class MainWindow(QMainWindow):
     @pyqtSlot(object)
     def _on_settings_changed(self, settings) -> None:
         self.app_state.settings = settings
-        from redteamai.config.manager import save_config
-        save_config(settings)
+        # Serialize a snapshot off the GUI thread; the live object keeps changing
+        snapshot = settings.model_copy(deep=True)
+        self._io_pool.start(lambda: _persist_settings(snapshot))
         self._setup_registry()
+        self._reset_agents()
         self._update_status_bar_backend()
-        self._status_bar.set_status("Settings saved")
+        self._queue_status("Settings saved")
 
     @pyqtSlot(str)
     def _health_check(self, backend_name: str) -> None:
-        import asyncio
-        from redteamai.ai.backend_factory import create_backend
-
+        # Repeat clicks while a check for this backend is in flight are ignored
+        if backend_name in self._health_pending:
+            return
+        self._health_pending.add(backend_name)
         old_backend = self.app_state.settings.ai_backend
         self.app_state.settings.ai_backend = backend_name
         backend = create_backend(self.app_state.settings)
         self.app_state.settings.ai_backend = old_backend
 
-        async def _check():
-            return await backend.health_check()
-
-        try:
-            loop = asyncio.new_event_loop()
-            ok, msg = loop.run_until_complete(_check())
-            loop.close()
-        except Exception as e:
-            ok, msg = False, str(e)
+        # Network round-trip runs on a worker thread so the window stays responsive
+        self._queue_status(f"Checking {backend_name}…")
+        self._health_worker.check(backend, backend_name)
 
+    def _on_health_checked(self, backend_name: str, ok: bool, msg: str) -> None:
+        self._health_pending.discard(backend_name)
+        self._queue_status(f"{backend_name}: {'OK' if ok else 'unreachable'}")
         icon = "✅" if ok else "❌"
         QMessageBox.information(self, f"{backend_name} Health Check", f"{icon} {msg}")
 
     @pyqtSlot(str, str)
     def _generate_report(self, fmt: str, path: str) -> None:
-        from redteamai.reporting.generator import generate_report
-        findings = self._reporting._findings
-        try:
-            generate_report(findings, fmt, path)
-            self._status_bar.set_status(f"Report saved: {path}")
-            QMessageBox.information(self, "Report Generated", f"Report saved to:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Report Error", str(e))
+        # Snapshot the list so later edits in the reporting module don't race the job
+        job = _ReportJob(list(self._reporting._findings), fmt, path)
+        job.signals.done.connect(self._on_report_done, Qt.ConnectionType.QueuedConnection)
+        job.signals.failed.connect(self._on_report_failed, Qt.ConnectionType.QueuedConnection)
+        self._queue_status("Generating report…")
+        self._reporting.set_generating(True)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_report_done(self, path: str) -> None:
+        self._reporting.set_generating(False)
+        self._queue_status(f"Report saved: {path}")
+        QMessageBox.information(self, "Report Generated", f"Report saved to:\n{path}")
+
+    def _on_report_failed(self, error: str) -> None:
+        self._reporting.set_generating(False)
+        self._queue_status("Report generation failed")
+        QMessageBox.critical(self, "Report Error", error)
 
     @pyqtSlot(str, str)
     def _save_output_to_project(self, label: str, content: str) -> None:
-        self._status_bar.set_status(f"Saved: {label}")
+        self._queue_status(f"Saved: {label}")
 
     def _cmd_palette(self) -> None:
-        self._status_bar.set_status("Command palette: Ctrl+K  (navigate with nav rail)")
+        self._queue_status("Command palette: Ctrl+K  (navigate with nav rail)")
 
     def _update_dashboard_stats(self) -> None:
-        available_tools = sum(1 for t in self._registry.list_tools() if t["available"])
-        self._dashboard.update_stats(tools=available_tools)
+        self._dashboard.update_stats(tools=self._cached_available)
+
+    def _queue_status(self, msg: str) -> None:
+        self._status_pending = msg
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _commit_status(self) -> None:
+        if self._status_pending is not None:
+            self._status_bar.set_status(self._status_pending)
+            self._status_pending = None
 
     def _update_status_bar_backend(self) -> None:
         backend_name = self.app_state.settings.ai_backend
@@ -427,4 +645,10 @@ class MainWindow(QMainWindow):
             self._ai_worker.stop()
         if self._tool_worker and self._tool_worker.isRunning():
             self._tool_worker.stop()
+        # Let the clients close before the loop they are bound to stops
+        wait_futures(self._reset_agents(), timeout=2)
+        self._ai_loop.stop()
+        self._health_worker.stop()
+        self._io_pool.waitForDone(3000)  # Let a pending config write finish
+        close_db()
         event.accept()
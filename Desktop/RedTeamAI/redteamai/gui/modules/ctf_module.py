@@ -1,13 +1,13 @@
 """CTF Module — encoding/decoding and challenge solver."""
 from __future__ import annotations
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QPlainTextEdit,
     QComboBox, QLineEdit, QGroupBox, QFormLayout, QSplitter, QTabWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
 
-OPERATIONS = [
+OPERATIONS = (
     ("base64_decode",  "Base64 → Text"),
     ("base64_encode",  "Text → Base64"),
     ("hex_decode",     "Hex → Text"),
@@ -27,7 +27,43 @@ OPERATIONS = [
     ("hash_sha256",    "SHA-256 Hash"),
     ("from_decimal",   "Decimal → Text"),
     ("to_decimal",     "Text → Decimal"),
-]
+)
+_OPERATION_LABELS = [name for _, name in OPERATIONS]
+
+# Operations that use the key field; editing the key re-runs these live
+_KEYED_OPS = frozenset({"caesar", "xor"})
+_KEY_DEBOUNCE_MS = 150
+
+# Decodings tried by "Auto-Detect" (the decode half of the first 10 operations)
+AUTO_DECODE_OPS = tuple((op_id, name) for op_id, name in OPERATIONS[:10] if "encode" not in op_id)
+
+
+class _AutoDecodeSignals(QObject):
+    done = pyqtSignal(int, str)  # (request generation, report text)
+
+
+class _AutoDecodeTask(QRunnable):
+    """Tries every auto-decode operation on a pool thread, off the GUI thread."""
+
+    def __init__(self, decoders: list[tuple[str, object]], text: str, generation: int):
+        super().__init__()
+        self.decoders = decoders
+        self.text = text
+        self.generation = generation
+        self.signals = _AutoDecodeSignals()
+
+    def run(self) -> None:
+        results = []
+        for op_name, fn in self.decoders:
+            try:
+                out = fn(self.text, "")
+            except Exception:
+                continue
+            if out and out != self.text:
+                results.append(f"[{op_name}]\n{out}\n")
+        self.signals.done.emit(
+            self.generation, "\n".join(results) if results else "No successful decodings found."
+        )
 
 
 class CTFModule(QWidget):
@@ -61,14 +97,25 @@ class CTFModule(QWidget):
         op_row = QHBoxLayout()
         op_label = QLabel("Operation:")
         self._op_combo = QComboBox()
-        for op_id, op_label_text in OPERATIONS:
-            self._op_combo.addItem(op_label_text, op_id)
+        # One insert for all labels, then attach the op ids without per-item model signals
+        self._op_combo.addItems(_OPERATION_LABELS)
+        model = self._op_combo.model()
+        model.blockSignals(True)
+        for i, (op_id, _) in enumerate(OPERATIONS):
+            self._op_combo.setItemData(i, op_id)
+        model.blockSignals(False)
         self._op_combo.setMinimumWidth(200)
 
         self._key_label = QLabel("Key:")
         self._key_input = QLineEdit()
         self._key_input.setPlaceholderText("Key (for XOR, Caesar shift)")
         self._key_input.setMaximumWidth(150)
+        # Re-run once typing pauses rather than on every keystroke
+        self._key_timer = QTimer(self)
+        self._key_timer.setSingleShot(True)
+        self._key_timer.setInterval(_KEY_DEBOUNCE_MS)
+        self._key_timer.timeout.connect(self._on_key_changed)
+        self._key_input.textChanged.connect(lambda _text: self._key_timer.start())
 
         run_btn = QPushButton("▶  Decode / Encode")
         run_btn.setObjectName("primary")
@@ -93,7 +140,7 @@ class CTFModule(QWidget):
         # Input
         input_group = QGroupBox("Input")
         input_lay = QVBoxLayout(input_group)
-        self._input_text = QTextEdit()
+        self._input_text = QPlainTextEdit()
         self._input_text.setPlaceholderText("Paste your encoded/encrypted text here…")
         self._input_text.setStyleSheet("background:#0d1117; color:#c9d1d9; border:none;")
         input_lay.addWidget(self._input_text)
@@ -111,7 +158,7 @@ class CTFModule(QWidget):
         output_btn_row.addWidget(copy_btn)
         output_btn_row.addWidget(use_as_input_btn)
 
-        self._output_text = QTextEdit()
+        self._output_text = QPlainTextEdit()
         self._output_text.setReadOnly(True)
         self._output_text.setStyleSheet("background:#0d1117; color:#3fb950; border:none;")
         output_lay.addLayout(output_btn_row)
@@ -134,6 +181,9 @@ class CTFModule(QWidget):
         # Internal tool instance for builtin ops
         from redteamai.tools.adapters.builtin_ctf import BuiltinCTFTool
         self._ctf_tool = BuiltinCTFTool()
+        self._auto_decoders = [(name, self._ctf_tool.decoder(op_id)) for op_id, name in AUTO_DECODE_OPS]
+        # Bumped per auto-decode request so results of superseded runs are dropped
+        self._auto_generation = 0
 
     def _run_operation(self) -> None:
         op = self._op_combo.currentData()
@@ -149,21 +199,24 @@ class CTFModule(QWidget):
             self._output_text.setPlainText(f"Error: {result.error}")
             self._output_text.setStyleSheet("background:#0d1117; color:#3fb950; border:none;")
 
+    def _on_key_changed(self) -> None:
+        # The timer fires after the last keystroke, so the final key is always used
+        if self._op_combo.currentData() in _KEYED_OPS and self._output_text.toPlainText():
+            self._run_operation()
+
     def _auto_decode(self) -> None:
         text = self._input_text.toPlainText().strip()
         if not text:
             return
-        results = []
-        for op_id, op_name in OPERATIONS[:10]:  # Try first 10 (encode/decode)
-            if "encode" in op_id:
-                continue
-            try:
-                r = self._ctf_tool.execute(operation=op_id, text=text)
-                if r.success and r.output and r.output != text:
-                    results.append(f"[{op_name}]\n{r.output}\n")
-            except Exception:
-                pass
-        self._output_text.setPlainText("\n".join(results) if results else "No successful decodings found.")
+        self._auto_generation += 1
+        self._output_text.setPlainText("Decoding…")
+        task = _AutoDecodeTask(self._auto_decoders, text, self._auto_generation)
+        task.signals.done.connect(self._on_auto_decoded)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_auto_decoded(self, generation: int, report: str) -> None:
+        if generation == self._auto_generation:
+            self._output_text.setPlainText(report)
 
     def _copy_output(self) -> None:
         from PyQt6.QtWidgets import QApplication
@@ -8,25 +8,28 @@ from PyQt6.QtCore import Qt, pyqtSignal
 
 
 class StatCard(QFrame):
-    def __init__(self, title: str, value: str, color: str = "#58a6ff", parent=None):
+    """Dashboard counter; colours come from the app stylesheet via the `accent` property."""
+
+    def __init__(self, title: str, value: str, accent: str = "blue", parent=None):
         super().__init__(parent)
-        self.setObjectName("card")
-        self.setStyleSheet(f"background:#161b22; border:1px solid #30363d; border-radius:8px; border-top: 3px solid {color};")
+        self.setObjectName("statCard")
+        self.setProperty("accent", accent)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
 
-        val_lbl = QLabel(value)
-        val_lbl.setStyleSheet(f"font-size:28px; font-weight:bold; color:{color}; background:transparent;")
+        val_lbl = self._value_lbl = QLabel(value)
+        val_lbl.setObjectName("statValue")
 
         title_lbl = QLabel(title)
         title_lbl.setObjectName("muted")
-        title_lbl.setStyleSheet("background:transparent;")
 
         layout.addWidget(val_lbl)
         layout.addWidget(title_lbl)
 
     def set_value(self, value: str) -> None:
-        self.layout().itemAt(0).widget().setText(value)
+        # Unchanged values would still invalidate the label's layout and repaint
+        if self._value_lbl.text() != value:
+            self._value_lbl.setText(value)
 
 
 class DashboardModule(QWidget):
@@ -51,10 +54,10 @@ class DashboardModule(QWidget):
 
         # Stats row
         stats_layout = QHBoxLayout()
-        self._hosts_card    = StatCard("Hosts Discovered", "0", "#58a6ff")
-        self._findings_card = StatCard("Findings",         "0", "#f85149")
-        self._tools_card    = StatCard("Tools Available",  "0", "#3fb950")
-        self._sessions_card = StatCard("Sessions",         "0", "#d29922")
+        self._hosts_card    = StatCard("Hosts Discovered", "0", "blue")
+        self._findings_card = StatCard("Findings",         "0", "red")
+        self._tools_card    = StatCard("Tools Available",  "0", "green")
+        self._sessions_card = StatCard("Sessions",         "0", "yellow")
 
         for card in [self._hosts_card, self._findings_card, self._tools_card, self._sessions_card]:
             stats_layout.addWidget(card)
@@ -62,27 +65,29 @@ class DashboardModule(QWidget):
 
         # Quick actions
         qa_label = QLabel("Quick Actions")
-        qa_label.setStyleSheet("font-size:14px; font-weight:bold; color:#8b949e;")
+        qa_label.setObjectName("sectionLabel")
         layout.addWidget(qa_label)
 
         actions = QHBoxLayout()
         quick_actions = [
-            ("🎯  New Target", "targets", "#1f6feb"),
-            ("🔍  Run Recon",  "recon",   "#3fb950"),
-            ("🌐  Web Scan",   "web_scan","#d29922"),
-            ("🚩  CTF Solver", "ctf",     "#bc8cff"),
+            ("🎯  New Target", "targets", "blue"),
+            ("🔍  Run Recon",  "recon",   "green"),
+            ("🌐  Web Scan",   "web_scan","yellow"),
+            ("🚩  CTF Solver", "ctf",     "purple"),
         ]
-        for label, module, color in quick_actions:
+        for label, module, accent in quick_actions:
             btn = QPushButton(label)
+            btn.setObjectName("quickAction")
+            btn.setProperty("accent", accent)
+            btn.setProperty("module_id", module)
             btn.setFixedHeight(44)
-            btn.setStyleSheet(f"background:{color}22; border:1px solid {color}; border-radius:8px; color:{color}; font-weight:bold; font-size:13px;")
-            btn.clicked.connect(lambda _, m=module: self.module_navigate.emit(m))
+            btn.clicked.connect(self._quick_action_clicked)
             actions.addWidget(btn)
         layout.addLayout(actions)
 
         # Recent activity
         recent_label = QLabel("Getting Started")
-        recent_label.setStyleSheet("font-size:14px; font-weight:bold; color:#8b949e;")
+        recent_label.setObjectName("sectionLabel")
         layout.addWidget(recent_label)
 
         tips = QFrame()
@@ -102,15 +107,23 @@ class DashboardModule(QWidget):
         for tip in tip_items:
             lbl = QLabel(tip)
             lbl.setObjectName("muted")
-            lbl.setStyleSheet("background:transparent;")
             lbl.setWordWrap(True)
             tips_layout.addWidget(lbl)
 
         layout.addWidget(tips)
         layout.addStretch()
 
+    def _quick_action_clicked(self) -> None:
+        # One slot shared by all quick-action buttons; the target rides on the button
+        self.module_navigate.emit(self.sender().property("module_id"))
+
     def update_stats(self, hosts: int = 0, findings: int = 0, tools: int = 0, sessions: int = 0) -> None:
-        self._hosts_card.set_value(str(hosts))
-        self._findings_card.set_value(str(findings))
-        self._tools_card.set_value(str(tools))
-        self._sessions_card.set_value(str(sessions))
+        # Repaint all four cards in one frame
+        self.setUpdatesEnabled(False)
+        try:
+            self._hosts_card.set_value(str(hosts))
+            self._findings_card.set_value(str(findings))
+            self._tools_card.set_value(str(tools))
+            self._sessions_card.set_value(str(sessions))
+        finally:
+            self.setUpdatesEnabled(True)
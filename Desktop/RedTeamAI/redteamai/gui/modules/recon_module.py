@@ -9,6 +9,23 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from redteamai.gui.widgets.terminal_output import TerminalWidget
 from redteamai.gui.widgets.collapsible_section import CollapsibleSection
 
+NMAP_SCAN_TYPES = (
+    ("sV", "Version"), ("sS", "SYN"), ("sT", "TCP"), ("sA", "ACK"),
+    ("sn", "Ping"), ("A", "Aggressive"), ("O", "OS"),
+)
+NMAP_TIMINGS = (
+    ("T3", "Normal"), ("T4", "Aggressive"), ("T5", "Insane"), ("T1", "Sneaky"), ("T2", "Polite"),
+)
+
+# (tool_name, extra kwargs) launched together by "Run All Passive Recon"
+PASSIVE_RECON = (
+    ("whois", {}),
+    ("dig", {"record_type": "A"}),
+    ("dig", {"record_type": "MX"}),
+    ("theharvester", {}),
+    ("subfinder", {}),
+)
+
 
 class ReconModule(QWidget):
     """Recon module: network scanning and OSINT."""
@@ -51,6 +68,10 @@ class ReconModule(QWidget):
         self._target_input = QLineEdit()
         self._target_input.setPlaceholderText("IP, hostname, or CIDR (e.g. 192.168.1.0/24)")
         tgt_lay.addWidget(self._target_input)
+        passive_btn = QPushButton("Run All Passive Recon")
+        passive_btn.setToolTip("Whois, Dig (A/MX), theHarvester and Subfinder in parallel")
+        passive_btn.clicked.connect(self._run_all_passive)
+        tgt_lay.addWidget(passive_btn)
         left_layout.addWidget(tgt_group)
 
         # Nmap
@@ -58,10 +79,13 @@ class ReconModule(QWidget):
         nmap_inner = QWidget()
         nmap_lay = QFormLayout(nmap_inner)
         nmap_lay.setSpacing(6)
+        # Item data holds the nmap flag, so a click reads it with currentData()
         self._nmap_scan_type = QComboBox()
-        self._nmap_scan_type.addItems(["sV (Version)", "sS (SYN)", "sT (TCP)", "sA (ACK)", "sn (Ping)", "A (Aggressive)", "O (OS)"])
+        for code, label in NMAP_SCAN_TYPES:
+            self._nmap_scan_type.addItem(f"{code} ({label})", code)
         self._nmap_timing = QComboBox()
-        self._nmap_timing.addItems(["T3 (Normal)", "T4 (Aggressive)", "T5 (Insane)", "T1 (Sneaky)", "T2 (Polite)"])
+        for code, label in NMAP_TIMINGS:
+            self._nmap_timing.addItem(f"{code} ({label})", code)
         self._nmap_timing.setCurrentIndex(1)
         self._nmap_ports = QLineEdit()
         self._nmap_ports.setPlaceholderText("e.g. 80,443,1-1024 (blank=top 1000)")
@@ -178,14 +202,10 @@ class ReconModule(QWidget):
         target = self._get_target()
         if not target:
             return
-        scan_map = {"sV (Version)": "sV", "sS (SYN)": "sS", "sT (TCP)": "sT",
-                    "sA (ACK)": "sA", "sn (Ping)": "sn", "A (Aggressive)": "A", "O (OS)": "O"}
-        timing_map = {"T3 (Normal)": "T3", "T4 (Aggressive)": "T4", "T5 (Insane)": "T5",
-                      "T1 (Sneaky)": "T1", "T2 (Polite)": "T2"}
         self.run_tool.emit("nmap", {
             "target": target,
-            "scan_type": scan_map.get(self._nmap_scan_type.currentText(), "sV"),
-            "timing": timing_map.get(self._nmap_timing.currentText(), "T4"),
+            "scan_type": self._nmap_scan_type.currentData() or "sV",
+            "timing": self._nmap_timing.currentData() or "T4",
             "ports": self._nmap_ports.text().strip(),
             "extra_args": self._nmap_extra.text().strip(),
         })
@@ -214,6 +234,16 @@ class ReconModule(QWidget):
         if target:
             self.run_tool.emit("subfinder", {"domain": target})
 
+    def _run_all_passive(self) -> None:
+        # These tools hit independent servers; the host runs each on its own
+        # pool thread, so total time is the slowest tool rather than the sum
+        target = self._get_target()
+        if not target:
+            return
+        for tool_name, extra in PASSIVE_RECON:
+            key = "target" if tool_name in ("whois", "dig") else "domain"
+            self.run_tool.emit(tool_name, {key: target, **extra})
+
     def _analyze_with_ai(self) -> None:
         output = self._terminal.terminal.get_full_text()
         if output.strip():
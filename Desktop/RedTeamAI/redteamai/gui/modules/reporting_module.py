@@ -2,12 +2,78 @@
 from __future__ import annotations
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit,
-    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QLineEdit,
-    QFileDialog, QSplitter, QMessageBox, QGroupBox
+    QTableView, QHeaderView, QComboBox, QLineEdit,
+    QFileDialog, QSplitter, QMessageBox, QGroupBox, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor, QTextDocument
 from redteamai.gui.widgets.finding_badge import FindingBadge
 
+# Format combo label -> (extension, file dialog filter)
+_FMT_MAP = {
+    "Markdown (.md)": ("md", "Markdown Files (*.md)"),
+    "HTML (.html)": ("html", "HTML Files (*.html)"),
+    "PDF (.pdf)": ("pdf", "PDF Files (*.pdf)"),
+}
+
+_SEV_COLORS = {
+    "critical": QColor("#ff4444"), "high": QColor("#f85149"),
+    "medium": QColor("#d29922"), "low": QColor("#3fb950"), "info": QColor("#58a6ff"),
+}
+
+
+class FindingsModel(QAbstractTableModel):
+    """Table model reading straight from the findings dicts; no per-cell items."""
+
+    _HEADERS = ("Severity", "Title", "Status")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.findings: list[dict] = []
+
+    def set_findings(self, findings: list[dict]) -> None:
+        self.beginResetModel()
+        self.findings = findings
+        self.endResetModel()
+
+    def append(self, finding: dict) -> None:
+        row = len(self.findings)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.findings.append(finding)
+        self.endInsertRows()
+
+    def extend(self, findings: list[dict]) -> None:
+        if not findings:
+            return
+        first = len(self.findings)
+        self.beginInsertRows(QModelIndex(), first, first + len(findings) - 1)
+        self.findings.extend(findings)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.findings)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        f = self.findings[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return f.get("severity", "info").upper()
+            if col == 1:
+                return f.get("title", "")
+            return f.get("status", "open")
+        if role == Qt.ItemDataRole.ForegroundRole and col == 0:
+            return _SEV_COLORS.get(f.get("severity", "info"), _SEV_COLORS["info"])
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._HEADERS[section]
+        return None
+
 
 class ReportingModule(QWidget):
     generate_report = pyqtSignal(str, str)  # (format, path)
@@ -16,7 +82,10 @@ class ReportingModule(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._findings: list[dict] = []
+        self._model = FindingsModel(self)
+        # Parsed preview per finding, keyed by id(): re-selecting swaps the
+        # document in instead of re-running the Markdown parser
+        self._preview_docs: dict[int, QTextDocument] = {}
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -53,13 +122,12 @@ class ReportingModule(QWidget):
         left_header.addWidget(add_finding_btn)
         left_layout.addLayout(left_header)
 
-        self._findings_table = QTableWidget()
-        self._findings_table.setColumnCount(3)
-        self._findings_table.setHorizontalHeaderLabels(["Severity", "Title", "Status"])
+        self._findings_table = QTableView()
+        self._findings_table.setModel(self._model)
         self._findings_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self._findings_table.setAlternatingRowColors(True)
-        self._findings_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._findings_table.itemClicked.connect(self._on_finding_selected)
+        self._findings_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self._findings_table.clicked.connect(self._on_finding_selected)
         left_layout.addWidget(self._findings_table)
 
         # ── Right: report generation ──────────────────────────────────────
@@ -75,13 +143,13 @@ class ReportingModule(QWidget):
         format_row = QHBoxLayout()
         format_row.addWidget(QLabel("Format:"))
         self._format_combo = QComboBox()
-        self._format_combo.addItems(["Markdown (.md)", "HTML (.html)", "PDF (.pdf)"])
+        self._format_combo.addItems(list(_FMT_MAP))
         format_row.addWidget(self._format_combo)
         format_row.addStretch()
         config_lay.addLayout(format_row)
 
         gen_row = QHBoxLayout()
-        gen_btn = QPushButton("📋 Generate Report")
+        gen_btn = self._gen_btn = QPushButton("📋 Generate Report")
         gen_btn.setObjectName("primary")
         gen_btn.setFixedHeight(38)
         gen_btn.clicked.connect(self._generate_report)
@@ -91,6 +159,14 @@ class ReportingModule(QWidget):
         gen_row.addWidget(gen_btn)
         gen_row.addWidget(ai_summary_btn)
         config_lay.addLayout(gen_row)
+
+        # Indeterminate bar shown while the host writes the report on a pool thread
+        self._gen_progress = QProgressBar()
+        self._gen_progress.setRange(0, 0)
+        self._gen_progress.setTextVisible(False)
+        self._gen_progress.setFixedHeight(4)
+        self._gen_progress.hide()
+        config_lay.addWidget(self._gen_progress)
         right_layout.addWidget(config_group)
 
         # Preview
@@ -100,6 +176,9 @@ class ReportingModule(QWidget):
 
         self._preview = QTextEdit()
         self._preview.setReadOnly(True)
+        self._text_doc = QTextDocument(self)  # Holds free-form previews from set_preview
+        self._text_doc.setDefaultFont(self._preview.font())
+        self._preview.setDocument(self._text_doc)
         self._preview.setStyleSheet("background:#0d1117; color:#c9d1d9; border:1px solid #30363d; border-radius:6px;")
         right_layout.addWidget(self._preview)
 
@@ -109,38 +188,47 @@ class ReportingModule(QWidget):
         splitter.setStretchFactor(1, 1)
         layout.addWidget(splitter)
 
+    @property
+    def _findings(self) -> list[dict]:
+        return self._model.findings
+
     def load_findings(self, findings: list[dict]) -> None:
-        self._findings = findings
-        self._refresh_table()
+        self._clear_preview_docs()
+        self._model.set_findings(findings)
+
+    def _clear_preview_docs(self) -> None:
+        self._preview.setDocument(self._text_doc)
+        for doc in self._preview_docs.values():
+            doc.deleteLater()
+        self._preview_docs.clear()
 
     def add_finding_data(self, finding: dict) -> None:
-        self._findings.append(finding)
-        self._refresh_table()
+        # Only the new row is inserted; existing rows aren't rebuilt
+        self._model.append(finding)
+
+    def add_findings_bulk(self, findings: list[dict]) -> None:
+        """Append many findings (e.g. from a scan import) with one row insertion."""
+        self._model.extend(findings)
+
+    def set_generating(self, busy: bool) -> None:
+        self._gen_progress.setVisible(busy)
+        self._gen_btn.setEnabled(not busy)
 
     def set_preview(self, text: str) -> None:
-        self._preview.setMarkdown(text)
-
-    def _refresh_table(self) -> None:
-        self._findings_table.setRowCount(len(self._findings))
-        for row, f in enumerate(self._findings):
-            sev_item = QTableWidgetItem(f.get("severity", "info").upper())
-            color_map = {
-                "critical": "#ff4444", "high": "#f85149",
-                "medium": "#d29922", "low": "#3fb950", "info": "#58a6ff"
-            }
-            sev = f.get("severity", "info")
-            from PyQt6.QtGui import QColor
-            sev_item.setForeground(QColor(color_map.get(sev, "#58a6ff")))
-            self._findings_table.setItem(row, 0, sev_item)
-            self._findings_table.setItem(row, 1, QTableWidgetItem(f.get("title", "")))
-            self._findings_table.setItem(row, 2, QTableWidgetItem(f.get("status", "open")))
-
-    def _on_finding_selected(self, item) -> None:
-        row = item.row()
+        self._text_doc.setMarkdown(text)
+        self._preview.setDocument(self._text_doc)
+
+    def _on_finding_selected(self, index: QModelIndex) -> None:
+        row = index.row()
         if row < len(self._findings):
             f = self._findings[row]
-            text = f"# {f.get('title', '')}\n\n**Severity:** {f.get('severity', '').upper()}\n\n{f.get('description', '')}\n\n**Remediation:**\n{f.get('remediation', 'Not specified')}"
-            self._preview.setMarkdown(text)
+            doc = self._preview_docs.get(id(f))
+            if doc is None:
+                text = f"# {f.get('title', '')}\n\n**Severity:** {f.get('severity', '').upper()}\n\n{f.get('description', '')}\n\n**Remediation:**\n{f.get('remediation', 'Not specified')}"
+                doc = self._preview_docs[id(f)] = QTextDocument(self)
+                doc.setDefaultFont(self._preview.font())
+                doc.setMarkdown(text)
+            self._preview.setDocument(doc)
 
     def _add_finding(self) -> None:
         from redteamai.gui.modules.settings_module import _SimpleDialog
@@ -189,11 +277,7 @@ class ReportingModule(QWidget):
             })
 
     def _generate_report(self) -> None:
-        fmt_map = {"Markdown (.md)": ("md", "Markdown Files (*.md)"),
-                   "HTML (.html)": ("html", "HTML Files (*.html)"),
-                   "PDF (.pdf)": ("pdf", "PDF Files (*.pdf)")}
-        fmt_text = self._format_combo.currentText()
-        ext, filter_str = fmt_map.get(fmt_text, ("md", "Markdown Files (*.md)"))
+        ext, filter_str = _FMT_MAP.get(self._format_combo.currentText(), _FMT_MAP["Markdown (.md)"])
 
         path, _ = QFileDialog.getSaveFileName(self, "Save Report", f"report.{ext}", filter_str)
         if path:
@@ -9,6 +9,18 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from redteamai.config.settings import AppSettings
 
 
+# Indices into SettingsModule._tab_builders
+_TAB_AI, _TAB_TOOLS, _TAB_UI = 0, 1, 2
+
+
+def _set_path(obj, path: str, value) -> None:
+    """setattr through a dotted path, e.g. _set_path(s, "ollama.host", v)."""
+    *parents, name = path.split(".")
+    for parent in parents:
+        obj = getattr(obj, parent)
+    setattr(obj, name, value)
+
+
 class _SimpleDialog:
     """Placeholder to avoid import issues."""
     pass
@@ -18,6 +30,19 @@ class SettingsModule(QWidget):
     settings_changed = pyqtSignal(AppSettings)
     health_check_requested = pyqtSignal(str)
 
+    # (settings path, QLineEdit attribute) for the AI backend text fields
+    _AI_FIELDS = (
+        ("ollama.host", "_ollama_host"),
+        ("ollama.model", "_ollama_model"),
+        ("groq.api_key", "_groq_key"),
+        ("groq.model", "_groq_model"),
+        ("anthropic.api_key", "_anthropic_key"),
+        ("anthropic.model", "_anthropic_model"),
+        ("openai_compat.api_key", "_openai_key"),
+        ("openai_compat.base_url", "_openai_base"),
+        ("openai_compat.model", "_openai_model"),
+    )
+
     def __init__(self, settings: AppSettings, parent=None):
         super().__init__(parent)
         self._settings = settings
@@ -41,13 +66,33 @@ class SettingsModule(QWidget):
         hl.addWidget(save_btn)
         layout.addWidget(header)
 
-        # Tabs
-        tabs = QTabWidget()
-        tabs.addTab(self._build_ai_tab(), "AI Backends")
-        tabs.addTab(self._build_tools_tab(), "Tool Paths")
-        tabs.addTab(self._build_ui_tab(), "UI / Behavior")
-        tabs.addTab(self._build_about_tab(), "About")
-        layout.addWidget(tabs)
+        # Tabs: placeholders until first shown; the AI tab is current, so it's built now
+        self._tab_builders = (
+            ("AI Backends", self._build_ai_tab),
+            ("Tool Paths", self._build_tools_tab),
+            ("UI / Behavior", self._build_ui_tab),
+            ("About", self._build_about_tab),
+        )
+        self._built_tabs: set[int] = set()
+        self._tabs = QTabWidget()
+        for label, _ in self._tab_builders:
+            self._tabs.addTab(QWidget(), label)
+        self._ensure_tab(_TAB_AI)
+        self._tabs.currentChanged.connect(self._ensure_tab)
+        layout.addWidget(self._tabs)
+
+    def _ensure_tab(self, index: int) -> None:
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        label, build = self._tab_builders[index]
+        placeholder = self._tabs.widget(index)
+        self._tabs.blockSignals(True)
+        self._tabs.removeTab(index)
+        self._tabs.insertTab(index, build(), label)
+        self._tabs.setCurrentIndex(index)
+        self._tabs.blockSignals(False)
+        placeholder.deleteLater()
 
     def _build_ai_tab(self) -> QWidget:
         scroll = QScrollArea()
@@ -142,7 +187,11 @@ class SettingsModule(QWidget):
         self._confirm_dangerous = QCheckBox("Require confirmation before dangerous tools")
         self._confirm_dangerous.setChecked(self._settings.require_confirm_dangerous)
         agent_lay.addRow("Max Iterations:", self._max_iter)
+        self._response_cache = QCheckBox("Reuse replies to identical requests (10 min)")
+        self._response_cache.setChecked(self._settings.response_cache_enabled)
+        self._response_cache.setToolTip("Off by default: asking the same question again returns the stored reply")
         agent_lay.addRow("", self._confirm_dangerous)
+        agent_lay.addRow("", self._response_cache)
         layout.addWidget(agent_group)
 
         layout.addStretch()
@@ -244,29 +293,30 @@ class SettingsModule(QWidget):
         return w
 
     def _save_settings(self) -> None:
-        from redteamai.config.settings import AppSettings, OllamaSettings, GroqSettings, AnthropicSettings, OpenAICompatSettings, ToolPaths
-
+        # Tabs never opened still hold the values they'd have been built with,
+        # so only built tabs are read back
         s = self._settings
-        s.ai_backend = self._backend_combo.currentText()
-        s.ollama.host = self._ollama_host.text()
-        s.ollama.model = self._ollama_model.text()
-        s.groq.api_key = self._groq_key.text()
-        s.groq.model = self._groq_model.text()
-        s.anthropic.api_key = self._anthropic_key.text()
-        s.anthropic.model = self._anthropic_model.text()
-        s.openai_compat.api_key = self._openai_key.text()
-        s.openai_compat.base_url = self._openai_base.text()
-        s.openai_compat.model = self._openai_model.text()
-        s.max_agent_iterations = self._max_iter.value()
-        s.require_confirm_dangerous = self._confirm_dangerous.isChecked()
-        s.font_size = self._font_size.value()
-        s.auto_save_session = self._auto_save.isChecked()
-
-        for field_name, edit in self._tool_edits.items():
-            setattr(s.tools, field_name, edit.text())
-        s.tools.metasploit_rpc_host = self._msf_host.text()
-        s.tools.metasploit_rpc_port = self._msf_port.value()
-        s.tools.metasploit_rpc_password = self._msf_pass.text()
+        if _TAB_AI in self._built_tabs:
+            # Read every field first, then apply; settings_changed fires once at the end
+            vals = {path: getattr(self, attr).text() for path, attr in self._AI_FIELDS}
+            s.ai_backend = self._backend_combo.currentText()
+            for path, value in vals.items():
+                _set_path(s, path, value)
+            s.max_agent_iterations = self._max_iter.value()
+            s.require_confirm_dangerous = self._confirm_dangerous.isChecked()
+            s.response_cache_enabled = self._response_cache.isChecked()
+
+        if _TAB_TOOLS in self._built_tabs:
+            tool_vals = {name: edit.text() for name, edit in self._tool_edits.items()}
+            for field_name, value in tool_vals.items():
+                setattr(s.tools, field_name, value)
+            s.tools.metasploit_rpc_host = self._msf_host.text()
+            s.tools.metasploit_rpc_port = self._msf_port.value()
+            s.tools.metasploit_rpc_password = self._msf_pass.text()
+
+        if _TAB_UI in self._built_tabs:
+            s.font_size = self._font_size.value()
+            s.auto_save_session = self._auto_save.isChecked()
 
         self.settings_changed.emit(s)
         QMessageBox.information(self, "Settings Saved", "Settings have been saved successfully.")
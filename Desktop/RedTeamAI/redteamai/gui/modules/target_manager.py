@@ -5,8 +5,8 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QFormLayout,
     QTextEdit, QComboBox, QMessageBox, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QKeySequence, QShortcut
 
 
 class AddTargetDialog(QDialog):
@@ -64,9 +64,13 @@ class TargetManagerModule(QWidget):
     target_selected = pyqtSignal(dict)
     scan_requested  = pyqtSignal(str)
 
+    # Built once instead of a dict literal and QColor per row on every refresh
+    _STATUS_FG = {"up": QColor("#3fb950"), "down": QColor("#f85149"), "unknown": QColor("#8b949e")}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._hosts: list[dict] = []
+        self._refresh_pending = False
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 20, 24, 20)
@@ -121,6 +125,20 @@ class TargetManagerModule(QWidget):
 
     def add_host(self, host: dict) -> None:
         self._hosts.append(host)
+        self._schedule_refresh()
+
+    def add_hosts_bulk(self, hosts: list[dict]) -> None:
+        self._hosts.extend(hosts)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        # Adds within one event-loop tick share a single table rebuild
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
         self._refresh_table(self._hosts)
 
     def _refresh_table(self, hosts: list[dict]) -> None:
@@ -130,8 +148,7 @@ class TargetManagerModule(QWidget):
             self._table.setItem(row, 1, QTableWidgetItem(h.get("hostname", "")))
             status = h.get("status", "unknown")
             status_item = QTableWidgetItem(status)
-            color_map = {"up": "#3fb950", "down": "#f85149", "unknown": "#8b949e"}
-            status_item.setForeground(__import__('PyQt6.QtGui', fromlist=['QColor']).QColor(color_map.get(status, "#8b949e")))
+            status_item.setForeground(self._STATUS_FG.get(status, self._STATUS_FG["unknown"]))
             self._table.setItem(row, 2, status_item)
             ports = h.get("open_ports", {})
             ports_str = ", ".join(str(p) for p in ports.keys()) if isinstance(ports, dict) else str(ports)
@@ -1,6 +1,7 @@
 """AI Chat Panel — streaming markdown chat with tool call display."""
 from __future__ import annotations
 import re
+from collections import deque
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QPlainTextEdit, QTextEdit, QScrollArea, QFrame, QSizePolicy
@@ -8,6 +9,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QKeySequence, QShortcut, QTextCursor, QColor
 
+# Oldest bubbles are dropped past this, like the terminals' block limit
+_MAX_BUBBLES = 200
+
 
 class MessageBubble(QFrame):
     """Single chat message bubble."""
@@ -172,7 +176,8 @@ class AIChatPanel(QWidget):
         self._shortcut.activated.connect(self._send)
 
         self._current_ai_bubble: MessageBubble | None = None
-        self._current_tool_bubble: ToolCallBubble | None = None
+        # Tool bubbles awaiting results; results arrive in call order
+        self._pending_tool_bubbles: deque[ToolCallBubble] = deque()
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -200,14 +205,13 @@ class AIChatPanel(QWidget):
     def add_tool_call(self, tool_name: str, args: dict) -> ToolCallBubble:
         bubble = ToolCallBubble(tool_name, args)
         self._insert_bubble(bubble)
-        self._current_tool_bubble = bubble
+        self._pending_tool_bubbles.append(bubble)
         self._scroll_to_bottom()
         return bubble
 
     def update_tool_result(self, output: str, error: bool = False) -> None:
-        if self._current_tool_bubble:
-            self._current_tool_bubble.set_result(output, error)
-            self._current_tool_bubble = None
+        if self._pending_tool_bubbles:
+            self._pending_tool_bubbles.popleft().set_result(output, error)
         self._scroll_to_bottom()
 
     def set_busy(self, busy: bool) -> None:
@@ -231,11 +235,17 @@ class AIChatPanel(QWidget):
             item = self._msg_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._pending_tool_bubbles.clear()
         self.clear_requested.emit()
 
     def _insert_bubble(self, widget: QWidget) -> None:
         # Insert before the stretch item
         self._msg_layout.insertWidget(self._msg_layout.count() - 1, widget)
+        while self._msg_layout.count() - 1 > _MAX_BUBBLES:
+            old = self._msg_layout.takeAt(0).widget()
+            if old in self._pending_tool_bubbles:
+                self._pending_tool_bubbles.remove(old)
+            old.deleteLater()
 
     def _scroll_to_bottom(self) -> None:
         sb = self._scroll.verticalScrollBar()
@@ -76,8 +76,12 @@ class NavRail(QWidget):
         self.module_changed.emit(module_id)
 
     def _activate(self, module_id: str) -> None:
-        for mid, btn in self._buttons.items():
-            btn.setChecked(mid == module_id)
+        # Only the previous and new buttons change; re-check the new one in
+        # case a click on the already-active button toggled it off
+        if module_id != self._active and self._active in self._buttons:
+            self._buttons[self._active].setChecked(False)
+        if module_id in self._buttons:
+            self._buttons[module_id].setChecked(True)
         self._active = module_id
 
     def _toggle(self) -> None:
@@ -1,5 +1,6 @@
 """ANSI-color-aware terminal output widget."""
 from __future__ import annotations
+from collections import deque
 from PyQt6.QtWidgets import QPlainTextEdit, QWidget, QVBoxLayout, QPushButton, QHBoxLayout
 from PyQt6.QtGui import QTextCursor, QTextCharFormat, QColor, QFont, QKeySequence
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -19,9 +20,30 @@ class TerminalOutput(QPlainTextEdit):
         self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self._default_fmt = QTextCharFormat()
         self._default_fmt.setForeground(QColor("#00ff41"))
+        # (text, color, is_ansi) appends received while hidden, rendered on show
+        self._hidden_appends: deque[tuple[str, str | None, bool]] = deque(maxlen=5000)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._render_hidden()
+
+    def _render_hidden(self) -> None:
+        while self._hidden_appends:
+            text, color, is_ansi = self._hidden_appends.popleft()
+            if is_ansi:
+                self._insert_ansi(text)
+            else:
+                self._insert_line(text, color)
 
     def append_ansi(self, text: str) -> None:
         """Append text with ANSI color codes rendered as Qt colors."""
+        # Hidden terminals (another module or tab) skip document layout until shown
+        if not self.isVisible():
+            self._hidden_appends.append((text, None, True))
+            return
+        self._insert_ansi(text)
+
+    def _insert_ansi(self, text: str) -> None:
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
@@ -44,6 +66,12 @@ class TerminalOutput(QPlainTextEdit):
 
     def append_line(self, text: str, color: str | None = None) -> None:
         """Append a plain line, optionally with a color."""
+        if not self.isVisible():
+            self._hidden_appends.append((text, color, False))
+            return
+        self._insert_line(text, color)
+
+    def _insert_line(self, text: str, color: str | None) -> None:
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         fmt = QTextCharFormat()
@@ -53,9 +81,11 @@ class TerminalOutput(QPlainTextEdit):
         self.ensureCursorVisible()
 
     def clear_output(self) -> None:
+        self._hidden_appends.clear()
         self.clear()
 
     def get_full_text(self) -> str:
+        self._render_hidden()
         return self.toPlainText()
 
     def keyPressEvent(self, event) -> None:
@@ -5,6 +5,7 @@ import binascii
 import hashlib
 import string
 import urllib.parse
+from functools import cached_property
 from redteamai.tools.base import BaseTool, ToolResult
 from redteamai.ai.tool_manifest import build_tool_schema, string_param, integer_param
 
@@ -53,7 +54,19 @@ class BuiltinCTFTool(BaseTool):
             return ToolResult(success=False, output="", error=str(e))
 
     def _dispatch(self, op: str, text: str, key: str) -> str:
-        ops = {
+        fn = self.decoder(op)
+        if not fn:
+            raise ValueError(f"Unknown operation: {op}")
+        return fn(text, key)
+
+    def decoder(self, op: str):
+        """Return the (text, key) -> str callable for an operation, or None."""
+        return self._ops.get(op)
+
+    @cached_property
+    def _ops(self) -> dict:
+        # Built once per instance instead of on every call
+        return {
             "base64_decode": self._b64_decode,
             "base64_encode": self._b64_encode,
             "hex_decode": self._hex_decode,
@@ -74,10 +87,6 @@ class BuiltinCTFTool(BaseTool):
             "from_decimal": lambda t, k: "".join(chr(int(x)) for x in t.split()),
             "to_decimal": lambda t, k: " ".join(str(ord(c)) for c in t),
         }
-        fn = ops.get(op)
-        if not fn:
-            raise ValueError(f"Unknown operation: {op}")
-        return fn(text, key)
 
     def _b64_decode(self, text: str, _: str) -> str:
         # Try standard, then URL-safe
@@ -108,11 +117,13 @@ class BuiltinCTFTool(BaseTool):
     def _hex_encode(self, text: str, _: str) -> str:
         return text.encode().hex()
 
+    _ROT13 = str.maketrans(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+        "NOPQRSTUVWXYZABCDEFGHIJKLMnopqrstuvwxyzabcdefghijklm",
+    )
+
     def _rot13(self, text: str, _: str) -> str:
-        return text.translate(str.maketrans(
-            "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
-            "NOPQRSTUVWXYZABCDEFGHIJKLMnopqrstuvwxyzabcdefghijklm",
-        ))
+        return text.translate(self._ROT13)
 
     def _caesar(self, text: str, key: str) -> str:
         shift = int(key) if key.lstrip("-").isdigit() else 13
@@ -2,6 +2,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 
@@ -51,6 +52,11 @@ class BaseTool(ABC):
     def get_schema(self) -> dict:
         """Return OpenAI-compatible function calling schema."""
 
+    @cached_property
+    def cached_schema(self) -> dict:
+        """get_schema(), built once per tool; treat the result as read-only."""
+        return self.get_schema()
+
     @abstractmethod
     def execute(self, **kwargs) -> ToolResult:
         """Execute the tool synchronously and return a ToolResult."""
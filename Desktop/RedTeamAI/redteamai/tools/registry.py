@@ -47,7 +47,7 @@ class ToolRegistry:
     def get_manifest(self) -> list[dict]:
         """Return OpenAI-compatible tool schemas for available tools."""
         return [
-            tool.get_schema()
+            tool.cached_schema
             for name, tool in self._tools.items()
             if self.is_available(name)
         ]
@@ -1,8 +1,10 @@
-"""QThread that runs the asyncio ReAct agent loop."""
+"""Runs the asyncio ReAct agent loop on a long-lived event-loop thread."""
 from __future__ import annotations
 import asyncio
+import concurrent.futures
+from typing import Coroutine
 import nest_asyncio
-from PyQt6.QtCore import QThread
+from PyQt6.QtCore import QObject, QThread
 from redteamai.ai.agent import (
     RedTeamAgent, TextChunkEvent, ToolCallEvent, ToolResultEvent,
     ConfirmationRequiredEvent, AgentDoneEvent, AgentErrorEvent
@@ -11,35 +13,85 @@ from redteamai.workers.worker_signals import AIWorkerSignals
 from redteamai.utils.logger import get_logger
 
 log = get_logger(__name__)
-nest_asyncio.apply()
+try:
+    nest_asyncio.apply()
+except ValueError:
+    pass  # uvloop loops can't be patched; the AI loop never nests anyway
 
 
-class AIWorker(QThread):
+class AILoopThread(QThread):
     """
-    Runs the RedTeamAgent ReAct loop in a dedicated thread with its own
-    asyncio event loop. Communicates back to Qt via AIWorkerSignals.
+    Long-lived thread hosting the asyncio event loop every agent turn runs on.
+
+    Backends bind their HTTP clients to the running loop, so one loop for
+    all turns lets a backend reuse its connections from message to message.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Created here so work can be submitted before the thread starts running it
+        self._loop = asyncio.new_event_loop()
+        if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+            # Run tasks inline until their first real suspension
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop; safe to call from any thread."""
+        if not self.isRunning():
+            self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def stop(self) -> None:
+        """Stop the event loop and wait for the thread to exit."""
+        if self.isRunning():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self.wait(3000)
+
+
+class AIWorker(QObject):
+    """
+    Runs one RedTeamAgent turn on the shared AILoopThread. Communicates
+    back to Qt via AIWorkerSignals. Keeps the QThread-style
+    start() / stop() / isRunning() interface.
     """
 
-    def __init__(self, agent: RedTeamAgent, user_message: str, parent=None):
+    def __init__(self, loop_thread: AILoopThread, agent: RedTeamAgent, user_message: str, parent=None):
         super().__init__(parent)
+        self.loop_thread = loop_thread
         self.agent = agent
         self.user_message = user_message
         self.signals = AIWorkerSignals()
-        self._loop: asyncio.AbstractEventLoop | None = None
+        self.future: concurrent.futures.Future | None = None
 
-    def run(self) -> None:
-        """QThread entry point — runs asyncio loop."""
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+    def start(self) -> None:
+        self.future = self.loop_thread.submit(self._run_agent())
+
+    def isRunning(self) -> bool:
+        return self.future is not None and not self.future.done()
+
+    def stop(self) -> None:
+        """Cancel the agent turn; the backend and its client stay open for reuse."""
+        if self.future is not None:
+            self.future.cancel()
+
+    async def _run_agent(self) -> None:
         try:
-            self._loop.run_until_complete(self._run_agent())
+            await self._dispatch_events()
+        except asyncio.CancelledError:
+            log.debug("AIWorker cancelled")
+            raise
         except Exception as e:
             log.exception("AIWorker crashed")
             self.signals.error.emit(str(e))
-        finally:
-            self._loop.close()
 
-    async def _run_agent(self) -> None:
+    async def _dispatch_events(self) -> None:
         async for event in self.agent.run(self.user_message):
             if isinstance(event, TextChunkEvent):
                 self.signals.text_chunk.emit(event.text)
@@ -60,9 +112,3 @@ class AIWorker(QThread):
 
             elif isinstance(event, AgentErrorEvent):
                 self.signals.error.emit(event.error)
-
-    def stop(self) -> None:
-        """Request the worker to stop."""
-        if self._loop and self._loop.is_running():
-            self._loop.call_soon_threadsafe(self._loop.stop)
-        self.wait(3000)
@@ -0,0 +1,58 @@
+"""QThread that runs backend health checks off the GUI thread."""
+from __future__ import annotations
+import asyncio
+from PyQt6.QtCore import QThread
+from redteamai.ai.base import AIBackend
+from redteamai.workers.worker_signals import HealthCheckSignals
+from redteamai.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+_CHECK_TIMEOUT_S = 5
+
+
+class HealthCheckWorker(QThread):
+    """
+    Long-lived thread hosting one asyncio event loop for health checks.
+
+    check() can be called from the GUI thread any number of times; each
+    call schedules AIBackend.health_check() on the same loop instead of
+    creating and closing a new loop per check.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.signals = HealthCheckSignals()
+        # Created here so checks can be queued before the thread starts running it
+        self._loop = asyncio.new_event_loop()
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def check(self, backend: AIBackend, label: str) -> None:
+        """Queue a health check; the result arrives via signals.done(label, ok, msg)."""
+        if not self.isRunning():
+            self.start()
+        asyncio.run_coroutine_threadsafe(self._check(backend, label), self._loop)
+
+    async def _check(self, backend: AIBackend, label: str) -> None:
+        try:
+            ok, msg = await asyncio.wait_for(backend.health_check(), _CHECK_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            ok, msg = False, f"No response within {_CHECK_TIMEOUT_S}s"
+        except Exception as e:
+            log.exception("Health check failed")
+            ok, msg = False, str(e)
+        finally:
+            await backend.aclose()
+        self.signals.done.emit(label, ok, msg)
+
+    def stop(self) -> None:
+        """Stop the event loop and wait for the thread to exit."""
+        if self.isRunning():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self.wait(3000)
@@ -1,21 +1,21 @@
-"""QThread that runs subprocess tools with live output streaming."""
+"""QProcess-based runner for subprocess tools with live output streaming."""
 from __future__ import annotations
-import sys
-import subprocess
-import time
-from PyQt6.QtCore import QThread
+import codecs
+from PyQt6.QtCore import QObject, QProcess, QTimer
 from redteamai.workers.worker_signals import ToolWorkerSignals
 from redteamai.utils.logger import get_logger
 
 log = get_logger(__name__)
 
-_HIDE_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
-
-class ToolWorker(QThread):
+class ToolWorker(QObject):
     """
-    Runs an external tool as a subprocess, streaming stdout+stderr
-    line-by-line via signals for real-time terminal output.
+    Runs an external tool as a QProcess, streaming stdout+stderr
+    as batches of lines via signals for real-time terminal output.
+
+    Output is read in chunks by Qt's event loop as it arrives, so no
+    thread or blocking readline loop is involved. Keeps the QThread-style
+    start() / stop() / isRunning() interface.
     """
 
     def __init__(self, command: list[str], cwd: str | None = None, timeout: int = 300, parent=None):
@@ -24,58 +24,80 @@ class ToolWorker(QThread):
         self.cwd = cwd
         self.timeout = timeout
         self.signals = ToolWorkerSignals()
-        self._process: subprocess.Popen | None = None
-        self._output_lines: list[str] = []
+        self._process: QProcess | None = None
+        self._output_chunks: list[str] = []
+        # Pieces of the current unterminated line, joined once its newline arrives
+        self._partial_parts: list[str] = []
+        # Incremental, so multi-byte characters split across reads decode correctly
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._on_timeout)
 
-    def run(self) -> None:
-        start = time.monotonic()
-        try:
-            self._process = subprocess.Popen(
-                self.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                cwd=self.cwd,
-                bufsize=1,  # Line-buffered
-                creationflags=_HIDE_WINDOW,
-            )
-        except FileNotFoundError as e:
-            msg = f"[Error] Tool not found: {self.command[0]}\n{e}"
-            self.signals.output_line.emit(msg)
-            self.signals.finished.emit(127, msg)
-            return
-        except OSError as e:
-            msg = f"[Error] Failed to launch tool: {e}"
-            self.signals.output_line.emit(msg)
-            self.signals.finished.emit(1, msg)
-            return
+    def start(self) -> None:
+        proc = self._process = QProcess(self)
+        proc.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        proc.setProgram(self.command[0])
+        proc.setArguments(self.command[1:])
+        if self.cwd:
+            proc.setWorkingDirectory(self.cwd)
+        proc.readyReadStandardOutput.connect(self._drain)
+        proc.finished.connect(self._on_finished)
+        proc.errorOccurred.connect(self._on_error)
+        self._timeout_timer.start(self.timeout * 1000)
+        proc.start()
 
-        try:
-            for line in iter(self._process.stdout.readline, ""):
-                if not self.isRunning():
-                    break
-                self._output_lines.append(line)
-                self.signals.output_line.emit(line.rstrip("\n"))
+    def isRunning(self) -> bool:
+        return self._process is not None and self._process.state() != QProcess.ProcessState.NotRunning
 
-                # Timeout check
-                if time.monotonic() - start > self.timeout:
-                    self._process.kill()
-                    self.signals.output_line.emit(f"\n[Timeout after {self.timeout}s — process killed]")
-                    break
+    def stop(self) -> None:
+        """Kill the subprocess."""
+        if self.isRunning():
+            self._process.kill()
+            self._process.waitForFinished(3000)
 
-            self._process.wait(timeout=10)
-        except Exception as e:
-            log.exception("ToolWorker error")
-            self.signals.output_line.emit(f"[Error] {e}")
+    def _drain(self) -> None:
+        text = self._decoder.decode(bytes(self._process.readAllStandardOutput()))
+        self._emit_text(text)
 
-        exit_code = self._process.returncode if self._process.returncode is not None else -1
-        full_output = "".join(self._output_lines)
-        self.signals.finished.emit(exit_code, full_output)
+    def _emit_text(self, text: str) -> None:
+        if not text:
+            return
+        self._output_chunks.append(text)
+        lines = text.split("\n")
+        if len(lines) == 1:
+            self._partial_parts.append(text)
+            return
+        self._partial_parts.append(lines[0])
+        lines[0] = "".join(self._partial_parts)
+        self._partial_parts = [lines.pop()]
+        # One signal per read rather than per line: noisy scans produce
+        # thousands of lines per chunk
+        self.signals.output_lines.emit([line.rstrip("\r") for line in lines])
 
-    def stop(self) -> None:
-        """Kill the subprocess and stop the thread."""
-        if self._process and self._process.poll() is None:
+    def _on_timeout(self) -> None:
+        if self.isRunning():
             self._process.kill()
-        self.wait(3000)
+            self.signals.output_lines.emit(["", f"[Timeout after {self.timeout}s — process killed]"])
+
+    def _on_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        self._timeout_timer.stop()
+        self._drain()
+        self._emit_text(self._decoder.decode(b"", final=True))
+        last_line = "".join(self._partial_parts)
+        self._partial_parts = []
+        if last_line:
+            self.signals.output_lines.emit([last_line.rstrip("\r")])
+        if exit_status != QProcess.ExitStatus.NormalExit:
+            exit_code = -1
+        self.signals.finished.emit(exit_code, "".join(self._output_chunks))
+
+    def _on_error(self, error: QProcess.ProcessError) -> None:
+        # Launch failures never reach finished(); other errors are reported there
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        self._timeout_timer.stop()
+        msg = f"[Error] Tool not found or failed to launch: {self.command[0]}\n{self._process.errorString()}"
+        log.warning("Failed to start %s: %s", self.command[0], self._process.errorString())
+        self.signals.output_lines.emit(msg.split("\n"))
+        self.signals.finished.emit(127, msg)
@@ -15,7 +15,12 @@ class AIWorkerSignals(QObject):
 
 class ToolWorkerSignals(QObject):
     """Signals emitted by ToolWorker."""
-    output_line = pyqtSignal(str)          # One line of stdout/stderr
+    output_lines = pyqtSignal(list)        # Complete stdout/stderr lines from one read
     finished = pyqtSignal(int, str)        # (exit_code, full_output)
     error = pyqtSignal(str)               # Subprocess launch error
     progress = pyqtSignal(int)            # Estimated progress 0-100 (optional)
+
+
+class HealthCheckSignals(QObject):
+    """Signals emitted by HealthCheckWorker."""
+    done = pyqtSignal(str, bool, str)      # (backend_name, healthy, status_message)
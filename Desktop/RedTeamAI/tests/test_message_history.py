@@ -0,0 +1,47 @@
+"""Tests for MessageHistory pruning."""
+from redteamai.ai.message_history import MessageHistory
+
+
+def _tool_turn(history: MessageHistory, call_id: str, size: int) -> None:
+    history.add_user("scan the target " + "q" * size)
+    history.add_assistant("", tool_calls=[{
+        "id": call_id,
+        "type": "function",
+        "function": {"name": "nmap_scan", "arguments": {"target": "10.0.0.1"}},
+    }])
+    history.add_tool_result(call_id, "nmap_scan", "r" * size)
+    history.add_assistant("a" * size)
+
+
+def _assert_tool_results_paired(messages: list[dict]) -> None:
+    seen_ids: set[str] = set()
+    for msg in messages:
+        for tc in msg.get("tool_calls") or []:
+            seen_ids.add(tc["id"])
+        if msg["role"] == "tool":
+            assert msg["tool_call_id"] in seen_ids
+
+
+def test_prune_does_not_leave_orphaned_tool_result():
+    history = MessageHistory(max_tokens=20)
+    _tool_turn(history, "call_1", 400)
+    _tool_turn(history, "call_2", 400)
+
+    history.prune()
+
+    assert history.messages
+    assert history.messages[0]["role"] != "tool"
+    _assert_tool_results_paired(history.messages)
+
+
+def test_prune_structured_fallback_cuts_on_user_turn():
+    history = MessageHistory(max_tokens=50)
+    for i in range(4):
+        _tool_turn(history, f"call_{i}", 2000)
+    history.add_user("next question")
+
+    history.prune_structured()
+
+    assert history.messages[0]["role"] == "user"
+    assert history.messages[-1] == {"role": "user", "content": "next question"}
+    _assert_tool_results_paired(history.messages)